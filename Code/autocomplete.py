@@ -1,5 +1,7 @@
 #!python
 
+from bisect import bisect_left
+import gzip
 import sys
 import time
 
@@ -13,22 +15,128 @@ def get_lines(filename='/usr/share/dict/words'):
     return lines
 
 
+def iter_lines(filename, chunk_size=1 << 20):
+    """Generate the non-empty strings on separate lines in the given text file
+    encoded as UTF-8, or gzip-compressed if its name ends with .gz, with any
+    leading and trailing whitespace characters removed from each line.
+    The file is read in chunks of the given number of bytes, so only one chunk
+    is held in memory at a time instead of a list of all lines."""
+    opener = gzip.open if filename.endswith('.gz') else open
+    with opener(filename, 'rb') as file:
+        # Pieces of the partial line at the end of the previous chunks, which
+        # are joined once the line ends instead of copied with every chunk
+        pieces = []
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            lines = chunk.split(b'\n')
+            if len(lines) == 1:
+                pieces.append(chunk)
+                continue
+            if pieces:
+                pieces.append(lines[0])
+                lines[0] = b''.join(pieces)
+            pieces = [lines.pop()]
+            for line in lines:
+                line = line.decode('utf-8').strip()
+                if line:
+                    yield line
+        line = b''.join(pieces).decode('utf-8').strip()
+        if line:
+            yield line
+
+
+def load_prefix_tree(filename, sorted_input=False, progress=None,
+                     progress_interval=100000):
+    """Return a prefix tree of the strings on separate lines in the given
+    text file (see iter_lines), inserting each string as soon as it is read so
+    peak memory is bounded by the tree rather than the tree and a list of all
+    lines. If the file is in sorted order, set sorted_input to build the tree
+    in one pass with PrefixTree.from_sorted. If given, the progress function
+    is called with the number of strings read after every progress_interval
+    strings and once at the end."""
+    from prefixtree import PrefixTree
+
+    def read_lines():
+        """Generate the lines of the file and report progress."""
+        count = 0
+        # Whether progress was already reported for the current count
+        reported = False
+        for count, line in enumerate(iter_lines(filename), 1):
+            yield line
+            reported = count % progress_interval == 0
+            if progress is not None and reported:
+                progress(count)
+        if progress is not None and not reported:
+            progress(count)
+
+    if sorted_input:
+        return PrefixTree.from_sorted(read_lines())
+    return PrefixTree(read_lines())
+
+
 def generate_prefixes(vocabulary):
     """Return a set of unique prefixes from the given list of strings."""
     # Generate prefixes using the first half of each string
     return set(word[:len(word)//2] for word in vocabulary)
 
 
+# Algorithms that autocomplete_setup and autocomplete can use
+# (numpy_scan requires the optional numpy package)
+ALGORITHMS = ('linear_search', 'sorted_array', 'numpy_scan', 'trie',
+              'compact_trie', 'radix_tree', 'dawg')
+
+# Largest Unicode code point, which cannot be incremented
+MAX_CODE_POINT = 0x10FFFF
+
+
+def sorted_array_range(prefix, words):
+    """Return the pair of indexes [low, high) of the range of entries in the
+    given sorted list of words that start with the given prefix, found with
+    two binary searches. Entries with a common prefix are contiguous in sorted
+    order, between the prefix itself and the least string greater than every
+    string that starts with it, which is the prefix with its last character
+    incremented."""
+    low = bisect_left(words, prefix)
+    # Drop trailing characters that cannot be incremented
+    end = prefix.rstrip(chr(MAX_CODE_POINT))
+    if end == '':
+        return low, len(words)
+    end = end[:-1] + chr(ord(end[-1]) + 1)
+    return low, bisect_left(words, end, low)
+
+
 def autocomplete_setup(vocabulary, algorithm='linear_search'):
     """Return the main data structure needed to set up autocomplete using the
     given vocabulary and algorithm, specified as linear_search, trie, etc."""
     if algorithm == 'linear_search':
         # Use the given vocabulary list
         return vocabulary
+    elif algorithm == 'sorted_array':
+        # Sort the vocabulary list once for binary search
+        return sorted(vocabulary)
+    elif algorithm == 'numpy_scan':
+        from autocomplete_numpy import VectorizedScan
+        # Pack the vocabulary into a byte matrix for vectorized scans
+        return VectorizedScan(vocabulary)
     elif algorithm == 'trie':
-        from trie import Trie
-        # Create a trie structure with the vocabulary
-        return Trie(vocabulary)
+        from prefixtree import PrefixTree
+        # Create a trie structure with the sorted vocabulary in one pass
+        return PrefixTree.from_sorted(sorted(vocabulary))
+    elif algorithm == 'compact_trie':
+        from compactprefixtree import CompactPrefixTree
+        # Create a trie structure stored in arrays with the vocabulary
+        return CompactPrefixTree(vocabulary)
+    elif algorithm == 'radix_tree':
+        from radixtree import RadixTree
+        # Create a path-compressed trie structure with the vocabulary
+        return RadixTree(vocabulary)
+    elif algorithm == 'dawg':
+        from dawg import DAWG
+        # Create a word graph structure with the sorted vocabulary
+        return DAWG(sorted(vocabulary))
+    raise ValueError('Unknown autocomplete algorithm {!r}'.format(algorithm))
 
 
 def autocomplete(prefix, structure, algorithm='linear_search'):
@@ -37,9 +145,25 @@ def autocomplete(prefix, structure, algorithm='linear_search'):
     if algorithm == 'linear_search':
         # Search the list using linear search
         return [word for word in structure if word.startswith(prefix)]
-    elif algorithm == 'trie':
+    elif algorithm == 'sorted_array':
+        # Slice the range of the sorted list found by binary search
+        low, high = sorted_array_range(prefix, structure)
+        return structure[low:high]
+    elif algorithm in ALGORITHMS:
         # Search the trie structure for the prefix
-        return structure.search(prefix)
+        return structure.complete(prefix)
+    raise ValueError('Unknown autocomplete algorithm {!r}'.format(algorithm))
+
+
+def autocomplete_many(prefixes, structure, algorithm='linear_search'):
+    """Return a dict that maps each of the given prefixes to all vocabulary
+    entries that start with it using the given structure and algorithm.
+    The trie algorithm answers all prefixes in one coordinated traversal and
+    the numpy_scan algorithm answers prefixes of equal length in one scan."""
+    if algorithm in ('trie', 'numpy_scan'):
+        return structure.complete_many(prefixes)
+    return {prefix: autocomplete(prefix, structure, algorithm)
+            for prefix in prefixes}
 
 
 def main():
@@ -62,15 +186,15 @@ def main():
         vocabulary = get_lines('/usr/share/dict/words')
 
         # Start the clock for benchmarking
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Set up autocomplete and mark the clock
         structure = autocomplete_setup(vocabulary)
-        setup_time = time.time()
+        setup_time = time.perf_counter()
 
         # Run autocomplete and mark the clock
         completions = autocomplete(prefix, structure)
-        end_time = time.time()
+        end_time = time.perf_counter()
 
         print('Vocabulary size: {}'.format(len(vocabulary)))
         print('Completions of {}: {}'.format(prefix, ', '.join(completions)))
@@ -85,21 +209,22 @@ def main():
         prefixes = get_lines(sys.argv[1])
 
         # Start the clock for benchmarking
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Set up autocomplete and mark the clock
         structure = autocomplete_setup(vocabulary)
-        setup_time = time.time()
+        setup_time = time.perf_counter()
 
-        # Run autocomplete with each prefix
+        # Run autocomplete with all prefixes
         num_completions = 0
+        results = autocomplete_many(prefixes, structure)
         for prefix in prefixes:
-            completions = autocomplete(prefix, structure)
+            completions = results[prefix]
             num_completions += len(completions)
             # print('Completions of {}: {}'.format(prefix, ', '.join(completions)))
 
         # Mark the clock
-        end_time = time.time()
+        end_time = time.perf_counter()
 
         print('Vocabulary size: {}'.format(len(vocabulary)))
         print('Found {} total completions of {} prefixes'
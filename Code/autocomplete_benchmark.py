@@ -0,0 +1,182 @@
+#!python3
+
+from autocomplete import (ALGORITHMS, autocomplete, autocomplete_setup,
+                          generate_prefixes)
+import argparse
+import json
+import multiprocessing
+import random
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Peak memory is not reported on Windows
+    resource = None
+
+
+# Relative frequencies of letters in English text, used to generate words
+LETTER_WEIGHTS = {
+    'a': 82, 'b': 15, 'c': 28, 'd': 43, 'e': 127, 'f': 22, 'g': 20, 'h': 61,
+    'i': 70, 'j': 2, 'k': 8, 'l': 40, 'm': 24, 'n': 67, 'o': 75, 'p': 19,
+    'q': 1, 'r': 60, 's': 63, 't': 91, 'u': 28, 'v': 10, 'w': 24, 'x': 2,
+    'y': 20, 'z': 1,
+}
+
+# Ways to choose the prefixes to query from a vocabulary
+DISTRIBUTIONS = ('half', 'short', 'random')
+
+
+def generate_vocabulary(size, seed=0):
+    """Return a list of the given number of unique random words whose letters
+    follow English letter frequencies, generated from the given seed."""
+    rng = random.Random(seed)
+    letters = list(LETTER_WEIGHTS)
+    weights = list(LETTER_WEIGHTS.values())
+    words = set()
+    while len(words) < size:
+        length = min(3 + int(rng.expovariate(1 / 5)), 20)
+        words.add(''.join(rng.choices(letters, weights, k=length)))
+    # Sort before shuffling, since the order of a set of strings depends on
+    # the hash seed, which differs between processes
+    vocabulary = sorted(words)
+    rng.shuffle(vocabulary)
+    return vocabulary
+
+
+def generate_queries(vocabulary, distribution, count, seed=0):
+    """Return a list of the given number of prefixes to query, sampled from
+    the vocabulary according to the given distribution: 'half' samples the
+    first half of words (see generate_prefixes), 'short' samples the first
+    one or two letters of words, and 'random' generates random strings that
+    mostly have no completions."""
+    rng = random.Random(seed)
+    if distribution == 'half':
+        prefixes = sorted(generate_prefixes(vocabulary))
+        return [rng.choice(prefixes) for _ in range(count)]
+    elif distribution == 'short':
+        return [rng.choice(vocabulary)[:rng.randint(1, 2)]
+                for _ in range(count)]
+    elif distribution == 'random':
+        letters = list(LETTER_WEIGHTS)
+        return [''.join(rng.choices(letters, k=rng.randint(2, 6)))
+                for _ in range(count)]
+    raise ValueError('Unknown prefix distribution {!r}'.format(distribution))
+
+
+def peak_rss_kib():
+    """Return the peak resident set size of this process in KiB, or None if
+    it cannot be measured on this platform."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB but macOS reports bytes
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def percentile(sorted_values, fraction):
+    """Return the value at the given fraction of the given sorted values."""
+    index = min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def available_algorithms():
+    """Return a list of the algorithms whose optional packages are
+    installed, which are the ones benchmarked by default."""
+    available = []
+    for algorithm in ALGORITHMS:
+        try:
+            autocomplete_setup(['a'], algorithm)
+        except ImportError:
+            continue  # Skip algorithms with missing optional packages
+        available.append(algorithm)
+    return available
+
+
+def run_benchmark(algorithm, size, distribution, num_queries, seed=0):
+    """Return a dict of measurements of autocomplete with the given algorithm
+    on a generated vocabulary of the given size, querying the given number of
+    prefixes chosen with the given distribution. Run it in a fresh process
+    so that peak memory reflects only this algorithm. Raise ValueError if the
+    number of queries is less than 1."""
+    if num_queries < 1:
+        raise ValueError('Cannot benchmark {} queries'.format(num_queries))
+    vocabulary = generate_vocabulary(size, seed)
+    queries = generate_queries(vocabulary, distribution, num_queries, seed)
+    baseline_rss = peak_rss_kib()
+
+    start_time = time.perf_counter()
+    structure = autocomplete_setup(vocabulary, algorithm)
+    setup_time = time.perf_counter() - start_time
+
+    latencies = []
+    num_completions = 0
+    for prefix in queries:
+        query_start = time.perf_counter()
+        completions = autocomplete(prefix, structure, algorithm)
+        latencies.append(time.perf_counter() - query_start)
+        num_completions += len(completions)
+    latencies.sort()
+    total_time = sum(latencies)
+
+    return {
+        'algorithm': algorithm,
+        'size': size,
+        'distribution': distribution,
+        'queries': num_queries,
+        'completions': num_completions,
+        'setup_sec': setup_time,
+        'latency_p50_usec': percentile(latencies, 0.50) * 1e6,
+        'latency_p90_usec': percentile(latencies, 0.90) * 1e6,
+        'latency_p99_usec': percentile(latencies, 0.99) * 1e6,
+        'latency_max_usec': latencies[-1] * 1e6,
+        'throughput_qps': num_queries / total_time if total_time else None,
+        'baseline_rss_kib': baseline_rss,
+        'peak_rss_kib': peak_rss_kib(),
+    }
+
+
+def main():
+    """Read command-line arguments, run each combination of algorithm,
+    vocabulary size and prefix distribution in its own process, and write one
+    JSON object of measurements per line."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark autocomplete algorithms on generated '
+                    'vocabularies and write JSON lines of measurements.')
+    parser.add_argument('--algorithms', nargs='+', choices=ALGORITHMS,
+                        default=available_algorithms())
+    parser.add_argument('--sizes', nargs='+', type=int,
+                        default=[10**3, 10**4, 10**5],
+                        help='vocabulary sizes, such as 1000 up to 10000000')
+    parser.add_argument('--distributions', nargs='+', choices=DISTRIBUTIONS,
+                        default=list(DISTRIBUTIONS))
+    parser.add_argument('--queries', type=int, default=1000,
+                        help='number of prefixes to query per run')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=argparse.FileType('w'),
+                        default=sys.stdout)
+    args = parser.parse_args()
+    if args.queries < 1:
+        parser.error('--queries must be at least 1')
+
+    # Spawn a new process per run so peak memory is not shared between runs
+    context = multiprocessing.get_context('spawn')
+    for size in args.sizes:
+        for algorithm in args.algorithms:
+            for distribution in args.distributions:
+                with context.Pool(1) as pool:
+                    try:
+                        result = pool.apply(run_benchmark, (
+                            algorithm, size, distribution, args.queries,
+                            args.seed))
+                    except ImportError as error:
+                        # Skip algorithms with missing optional packages
+                        print('Skipping {}: {}'.format(algorithm, error),
+                              file=sys.stderr)
+                        continue
+                args.output.write(json.dumps(result) + '\n')
+                args.output.flush()
+
+
+if __name__ == '__main__':
+    main()
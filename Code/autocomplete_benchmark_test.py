@@ -0,0 +1,108 @@
+#!python3
+
+from autocomplete import ALGORITHMS
+from autocomplete_benchmark import (DISTRIBUTIONS, available_algorithms,
+                                    generate_queries, generate_vocabulary,
+                                    percentile, run_benchmark)
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+
+class AutocompleteBenchmarkTest(unittest.TestCase):
+
+    def test_generate_vocabulary(self):
+        vocabulary = generate_vocabulary(500, seed=1)
+        assert len(vocabulary) == 500
+        # Verify words are unique, lowercase and at least 3 letters long
+        assert len(set(vocabulary)) == 500
+        assert all(word.isalpha() and word.islower() for word in vocabulary)
+        assert all(3 <= len(word) <= 20 for word in vocabulary)
+        # Verify the same seed generates the same words in the same order
+        assert generate_vocabulary(500, seed=1) == vocabulary
+        assert generate_vocabulary(500, seed=2) != vocabulary
+        assert generate_vocabulary(0) == []
+
+    def test_generate_vocabulary_across_processes(self):
+        # Verify each benchmark process gets the same words in the same order,
+        # although the order of a set of strings depends on the hash seed
+        code = ('from autocomplete_benchmark import generate_vocabulary; '
+                'print(generate_vocabulary(200))')
+        directory = os.path.dirname(os.path.abspath(__file__))
+        outputs = []
+        for hash_seed in ('1', '2'):
+            environment = dict(os.environ, PYTHONHASHSEED=hash_seed)
+            outputs.append(subprocess.run(
+                [sys.executable, '-c', code], cwd=directory, env=environment,
+                capture_output=True, text=True, check=True).stdout)
+        assert outputs[0] == outputs[1]
+        assert outputs[0] == str(generate_vocabulary(200)) + '\n'
+
+    def test_generate_queries(self):
+        vocabulary = generate_vocabulary(200)
+        for distribution in DISTRIBUTIONS:
+            queries = generate_queries(vocabulary, distribution, 100, seed=3)
+            assert len(queries) == 100
+            assert all(isinstance(prefix, str) for prefix in queries)
+            # Verify the same seed generates the same queries
+            assert generate_queries(vocabulary, distribution, 100,
+                                    seed=3) == queries
+        # Verify half prefixes and short prefixes start vocabulary words
+        for distribution in ('half', 'short'):
+            for prefix in generate_queries(vocabulary, distribution, 100):
+                assert any(word.startswith(prefix) for word in vocabulary)
+        short = generate_queries(vocabulary, 'short', 100)
+        assert all(1 <= len(prefix) <= 2 for prefix in short)
+        random_prefixes = generate_queries(vocabulary, 'random', 100)
+        assert all(2 <= len(prefix) <= 6 for prefix in random_prefixes)
+        with self.assertRaises(ValueError):
+            generate_queries(vocabulary, 'zipf', 10)
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        assert percentile(values, 0.0) == 1
+        assert percentile(values, 0.5) == 51
+        assert percentile(values, 0.99) == 100
+        # Verify the last value is used when the fraction reaches the end
+        assert percentile(values, 1.0) == 100
+        assert percentile([7], 0.9) == 7
+
+    def test_run_benchmark(self):
+        result = run_benchmark('trie', 100, 'short', 50, seed=4)
+        assert set(result) == {
+            'algorithm', 'size', 'distribution', 'queries', 'completions',
+            'setup_sec', 'latency_p50_usec', 'latency_p90_usec',
+            'latency_p99_usec', 'latency_max_usec', 'throughput_qps',
+            'baseline_rss_kib', 'peak_rss_kib'}
+        assert result['algorithm'] == 'trie'
+        assert result['size'] == 100
+        assert result['distribution'] == 'short'
+        assert result['queries'] == 50
+        assert result['setup_sec'] >= 0
+        assert (result['latency_p50_usec'] <= result['latency_p90_usec'] <=
+                result['latency_p99_usec'] <= result['latency_max_usec'])
+        # Verify the measurements are written as one line of JSON
+        assert json.loads(json.dumps(result)) == result
+        with self.assertRaises(ValueError):
+            run_benchmark('trie', 100, 'short', 0)
+
+    def test_available_algorithms(self):
+        algorithms = available_algorithms()
+        # Verify every algorithm without optional packages is available
+        for algorithm in ALGORITHMS:
+            if algorithm != 'numpy_scan':
+                assert algorithm in algorithms
+        assert all(algorithm in ALGORITHMS for algorithm in algorithms)
+
+    def test_run_benchmark_with_default_algorithms(self):
+        for algorithm in available_algorithms():
+            result = run_benchmark(algorithm, 50, 'half', 20)
+            assert result['algorithm'] == algorithm
+            assert result['queries'] == 20
+            assert result['completions'] >= 20
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+#!python3
+
+import numpy as np
+
+
+class VectorizedScan:
+    """VectorizedScan: An autocomplete structure that answers prefix queries
+    by scanning the whole vocabulary like linear search, but with NumPy array
+    comparisons instead of a Python loop. Words are encoded as UTF-8 and packed
+    into a fixed-width byte matrix with one row per word, padded with zeros,
+    so a scan runs at memory bandwidth rather than interpreter speed. Requires
+    the optional numpy package."""
+
+    # Maximum prefix length in bytes that fits in one 64-bit integer key
+    KEY_BYTES = 8
+
+    def __init__(self, vocabulary):
+        """Initialize this structure with the words in the given vocabulary."""
+        self.words = list(vocabulary)
+        encoded = [word.encode('utf-8') for word in self.words]
+        # Length in bytes of each encoded word
+        self.lengths = np.fromiter(map(len, encoded), dtype=np.int64,
+                                   count=len(encoded))
+        self.width = max(self.lengths.max(initial=0), 1)
+        # Matrix of bytes with one zero-padded row per word
+        self.matrix = np.frombuffer(
+            b''.join(word.ljust(self.width, b'\0') for word in encoded),
+            dtype=np.uint8).reshape(len(encoded), self.width)
+
+    def __len__(self):
+        """Return the number of words in this structure."""
+        return len(self.words)
+
+    def _match(self, prefix):
+        """Return a boolean array that marks the words that start with the
+        given prefix encoded as UTF-8 bytes."""
+        length = len(prefix)
+        if length > self.width:
+            return np.zeros(len(self.words), dtype=bool)
+        pattern = np.frombuffer(prefix, dtype=np.uint8)
+        matches = (self.matrix[:, :length] == pattern).all(axis=1)
+        # Padding bytes must not match a prefix that ends with zero bytes
+        return matches & (self.lengths >= length)
+
+    def complete(self, prefix):
+        """Return a list of all words in this structure that start with the
+        given prefix, in vocabulary order.
+        Time Complexity:
+            O(n*m) array operations where n is the number of words and m is
+            the length of the prefix"""
+        indexes = np.flatnonzero(self._match(prefix.encode('utf-8')))
+        return [self.words[index] for index in indexes]
+
+    def _keys(self, length):
+        """Return an array with a 64-bit integer key for each word that packs
+        its first length bytes in big-endian order, so that keys are equal if
+        and only if the words' first length bytes are equal."""
+        padded = np.zeros((len(self.words), VectorizedScan.KEY_BYTES),
+                          dtype=np.uint8)
+        padded[:, :length] = self.matrix[:, :length]
+        return padded.view('>u8').ravel()
+
+    def complete_many(self, prefixes):
+        """Return a dict that maps each of the given prefixes to a list of all
+        words in this structure that start with it, in vocabulary order.
+        Prefixes of up to KEY_BYTES bytes are grouped by length, and each group
+        is matched in one scan by packing the first bytes of every word into an
+        integer key and binary searching the group's sorted keys for it.
+        Time Complexity:
+            O(n*log(p)) array operations per prefix length, where n is the
+            number of words and p is the number of prefixes of that length"""
+        results = {}
+        groups = {}
+        for prefix in set(prefixes):
+            encoded = prefix.encode('utf-8')
+            if len(encoded) > min(VectorizedScan.KEY_BYTES, self.width):
+                results[prefix] = self.complete(prefix)
+            else:
+                groups.setdefault(len(encoded), []).append((encoded, prefix))
+
+        for length, group in groups.items():
+            group.sort()
+            prefix_keys = np.frombuffer(
+                b''.join(encoded.ljust(VectorizedScan.KEY_BYTES, b'\0')
+                         for encoded, _ in group), dtype='>u8')
+            word_keys = self._keys(length)
+            # Find the prefix whose key equals each word's key, if any
+            positions = np.searchsorted(prefix_keys, word_keys)
+            positions[positions == len(group)] = 0
+            matched = ((prefix_keys[positions] == word_keys) &
+                       (self.lengths >= length))
+            indexes = np.flatnonzero(matched)
+            positions = positions[indexes]
+            # Group the matched words by prefix, keeping vocabulary order
+            order = np.argsort(positions, kind='stable')
+            bounds = np.searchsorted(positions[order],
+                                     np.arange(len(group) + 1))
+            for number, (_, prefix) in enumerate(group):
+                matches = indexes[order[bounds[number]:bounds[number + 1]]]
+                results[prefix] = [self.words[index] for index in matches]
+        return results
@@ -0,0 +1,224 @@
+#!python3
+
+from autocomplete import get_lines
+from prefixtree import PrefixTree
+from bisect import bisect_right
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import threading
+
+
+def parse_vocabulary(lines):
+    """Return a sorted list of (word, score) pairs from the given lines, which
+    contain a word optionally followed by a tab and its numeric score."""
+    entries = {}
+    for line in lines:
+        word, _, score = line.partition('\t')
+        if word:
+            entries[word] = float(score) if score else 0
+    return sorted(entries.items())
+
+
+def shard_starts(words, num_shards):
+    """Return a sorted list of the leading characters at which each shard's
+    range of words starts, so that shards hold similar numbers of the given
+    sorted words and all words with the same leading character share a shard.
+    The first shard also holds the empty string and any character before it."""
+    counts = {}
+    for word in words:
+        if word:
+            counts[word[0]] = counts.get(word[0], 0) + 1
+    if not counts:
+        return ['']
+    starts = []
+    total = sum(counts.values())
+    seen = 0
+    for char in sorted(counts):
+        # Start a new shard once the previous ones hold their share of words
+        if not starts or (len(starts) < num_shards and
+                          seen >= total * len(starts) / num_shards):
+            starts.append(char)
+        seen += counts[char]
+    starts[0] = ''
+    return starts
+
+
+def shard_index(starts, prefix):
+    """Return the index of the shard whose range holds words that start with
+    the given non-empty prefix."""
+    return bisect_right(starts, prefix[0]) - 1
+
+
+def serve_shard(connection, entries):
+    """Build a prefix tree from the given sorted (word, score) pairs and answer
+    requests received on the given connection until it receives None."""
+    tree = PrefixTree.from_sorted(word for word, _ in entries)
+    for word, score in entries:
+        if score:
+            tree.insert(word, score)
+    while True:
+        request = connection.recv()
+        if request is None:
+            break
+        operation, prefix, k = request
+        if operation == 'complete':
+            connection.send(list(tree.iter_complete(prefix, sort=True)))
+        else:
+            connection.send(tree.top_k(prefix, k, with_scores=True))
+    connection.close()
+
+
+class AutocompleteServer:
+    """AutocompleteServer: A long-lived autocomplete service that splits its
+    vocabulary into shards by ranges of leading characters, builds a prefix
+    tree for each shard in its own process so queries use all cores, and
+    merges the results of the shards that a query's prefix falls in."""
+
+    def __init__(self, lines, num_shards=None):
+        """Start a process for each shard of the vocabulary in the given lines
+        (see parse_vocabulary), using one shard per core by default."""
+        entries = parse_vocabulary(lines)
+        self.size = len(entries)
+        num_shards = num_shards or os.cpu_count() or 1
+        self.starts = shard_starts([word for word, _ in entries], num_shards)
+        # Connection to each shard process and a lock that pairs each request
+        # sent on it with its response
+        self.connections = []
+        self.locks = []
+        self.processes = []
+        shard_entries = [[] for _ in self.starts]
+        for word, score in entries:
+            shard_entries[shard_index(self.starts, word)].append((word, score))
+        for shard_vocabulary in shard_entries:
+            connection, child_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=serve_shard, args=(child_connection, shard_vocabulary),
+                daemon=True)
+            process.start()
+            child_connection.close()
+            self.connections.append(connection)
+            self.locks.append(threading.Lock())
+            self.processes.append(process)
+
+    def close(self):
+        """Stop all shard processes."""
+        for connection, lock in zip(self.connections, self.locks):
+            with lock:
+                connection.send(None)
+                connection.close()
+        for process in self.processes:
+            process.join()
+
+    def _shards(self, prefix):
+        """Return the indexes of the shards that may hold completions of the
+        given prefix."""
+        if prefix == '':
+            return range(len(self.starts))
+        return [shard_index(self.starts, prefix)]
+
+    def _ask(self, shard, request):
+        """Send the given request to the given shard and return its response."""
+        with self.locks[shard]:
+            self.connections[shard].send(request)
+            return self.connections[shard].recv()
+
+    def _merge(self, operation, k, responses):
+        """Merge the given responses of shards in order of their ranges."""
+        if operation == 'complete':
+            # Each shard's completions are sorted and ranges are in order
+            return [word for response in responses for word in response]
+        results = [result for response in responses for result in response]
+        results.sort(key=lambda result: (-result[1], result[0]))
+        return results[:k]
+
+    def query(self, operation, prefix, k=10):
+        """Return all completions of the given prefix in lexicographic order if
+        the operation is 'complete', or the top k (word, score) pairs if the
+        operation is 'top_k', or raise ValueError for other operations."""
+        if operation not in ('complete', 'top_k'):
+            raise ValueError(f'Unknown operation {operation!r}')
+        request = (operation, prefix, k)
+        responses = [self._ask(shard, request)
+                     for shard in self._shards(prefix)]
+        return self._merge(operation, k, responses)
+
+    async def query_async(self, operation, prefix, k=10):
+        """Return the result of query without blocking the event loop, asking
+        all shards that the prefix falls in concurrently."""
+        if operation not in ('complete', 'top_k'):
+            raise ValueError(f'Unknown operation {operation!r}')
+        loop = asyncio.get_running_loop()
+        request = (operation, prefix, k)
+        responses = await asyncio.gather(*(
+            loop.run_in_executor(None, self._ask, shard, request)
+            for shard in self._shards(prefix)))
+        return self._merge(operation, k, responses)
+
+    async def handle_client(self, reader, writer):
+        """Answer requests from a client, one JSON object per line such as
+        {"op": "complete", "prefix": "axl"} or {"op": "top_k", "prefix": "a",
+        "k": 10}, with one JSON object per line holding either "completions"
+        or an "error" message."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    completions = await self.query_async(
+                        request.get('op', 'complete'), request['prefix'],
+                        int(request.get('k', 10)))
+                    response = {'completions': completions}
+                except (ValueError, KeyError, TypeError,
+                        AttributeError) as error:
+                    response = {'error': str(error)}
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self, address):
+        """Serve clients on the given address until cancelled: a UNIX socket
+        path, or a 'host:port' string for TCP."""
+        host, _, port = address.rpartition(':')
+        if host and port.isdigit():
+            server = await asyncio.start_server(self.handle_client, host,
+                                                int(port))
+        else:
+            server = await asyncio.start_unix_server(self.handle_client,
+                                                     address)
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    """Read command-line arguments and serve autocomplete requests."""
+    if len(sys.argv) < 3:
+        script = sys.argv[0]  # Get script file name
+        print('Usage: {} vocabulary-file address [shards]'.format(script))
+        print('Serve autocomplete requests for the given vocabulary file, '
+              'with one word and an optional tab-separated score per line')
+        print('Example: {} /usr/share/dict/words /tmp/autocomplete.sock'
+              .format(script))
+        print('Example: {} /usr/share/dict/words 127.0.0.1:8765 4'
+              .format(script))
+        return
+
+    num_shards = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    server = AutocompleteServer(get_lines(sys.argv[1]), num_shards)
+    print('Serving {} words in {} shards on {}'
+          .format(server.size, len(server.starts), sys.argv[2]))
+    try:
+        asyncio.run(server.serve(sys.argv[2]))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+#!python3
+
+from autocomplete_server import (AutocompleteServer, parse_vocabulary,
+                                 shard_index, shard_starts)
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+
+class AutocompleteServerTest(unittest.TestCase):
+
+    def test_parse_vocabulary(self):
+        lines = ['beta\t2', 'alpha', '', 'beta\t3']
+        assert parse_vocabulary(lines) == [('alpha', 0), ('beta', 3.0)]
+
+    def test_shard_starts(self):
+        words = ['apple', 'avocado', 'banana', 'cherry', 'date', 'dill']
+        starts = shard_starts(words, 3)
+        assert starts == ['', 'b', 'd']
+        assert shard_index(starts, 'av') == 0
+        assert shard_index(starts, 'c') == 1
+        assert shard_index(starts, 'dates') == 2
+        assert shard_index(starts, 'A') == 0
+        # Verify there are never more shards than leading characters
+        assert shard_starts(words, 10) == ['', 'b', 'c', 'd']
+        assert shard_starts([], 4) == ['']
+
+    def test_queries_merge_shards(self):
+        lines = ['apple\t5', 'avocado\t9', 'banana\t7', 'cherry', 'date\t1']
+        server = AutocompleteServer(lines, num_shards=2)
+        try:
+            assert len(server.starts) == 2
+            assert server.query('complete', 'a') == ['apple', 'avocado']
+            assert server.query('complete', 'x') == []
+            assert server.query('complete', '') == \
+                ['apple', 'avocado', 'banana', 'cherry', 'date']
+            assert server.query('top_k', '', 2) == \
+                [('avocado', 9), ('banana', 7)]
+            with self.assertRaises(ValueError):
+                server.query('search', 'a')
+        finally:
+            server.close()
+
+    def test_serve_unix_socket(self):
+        server = AutocompleteServer(['apple', 'avocado', 'banana'], 2)
+
+        async def exchange(path):
+            task = asyncio.ensure_future(server.serve(path))
+            while not os.path.exists(path):
+                await asyncio.sleep(0.01)
+            reader, writer = await asyncio.open_unix_connection(path)
+            responses = []
+            for request in [{'op': 'complete', 'prefix': 'a'},
+                            {'op': 'top_k', 'prefix': '', 'k': 1},
+                            {'op': 'search', 'prefix': 'a'}]:
+                writer.write(json.dumps(request).encode() + b'\n')
+                responses.append(json.loads(await reader.readline()))
+            writer.close()
+            task.cancel()
+            return responses
+
+        try:
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'autocomplete.sock')
+                responses = asyncio.run(exchange(path))
+        finally:
+            server.close()
+        assert responses[0] == {'completions': ['apple', 'avocado']}
+        assert responses[1] == {'completions': [['apple', 0]]}
+        assert 'error' in responses[2]
+
+
+if __name__ == '__main__':
+    unittest.main()
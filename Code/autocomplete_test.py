@@ -0,0 +1,114 @@
+#!python3
+
+from autocomplete import (ALGORITHMS, MAX_CODE_POINT, autocomplete,
+                          autocomplete_many, autocomplete_setup,
+                          generate_prefixes, iter_lines, load_prefix_tree,
+                          sorted_array_range)
+import gzip
+import os
+import tempfile
+import unittest
+
+
+class AutocompleteTest(unittest.TestCase):
+
+    vocabulary = ['axle', 'axled', 'axlesmith', 'axletree', 'ax', 'bee',
+                  'beech', 'zebra', 'Axle']
+
+    def test_algorithms_agree(self):
+        prefixes = generate_prefixes(self.vocabulary) | {'', 'axles', 'q'}
+        expected = {prefix: sorted(word for word in self.vocabulary
+                                   if word.startswith(prefix))
+                    for prefix in prefixes}
+        for algorithm in ALGORITHMS:
+            try:
+                structure = autocomplete_setup(self.vocabulary, algorithm)
+            except ImportError:
+                continue  # Skip algorithms with missing optional packages
+            for prefix in prefixes:
+                completions = autocomplete(prefix, structure, algorithm)
+                assert sorted(completions) == expected[prefix], algorithm
+            results = autocomplete_many(prefixes, structure, algorithm)
+            assert {prefix: sorted(completions) for prefix, completions
+                    in results.items()} == expected, algorithm
+
+    def test_numpy_scan_many_prefixes(self):
+        try:
+            structure = autocomplete_setup(self.vocabulary, 'numpy_scan')
+        except ImportError:
+            self.skipTest('numpy is not installed')
+        prefixes = ['', 'a', 'ax', 'axl', 'axle', 'axles', 'axlesmit',
+                    'axlesmith', 'axlesmiths', 'b', 'be', 'z', 'zz', 'A']
+        results = autocomplete_many(prefixes, structure, 'numpy_scan')
+        for prefix in prefixes:
+            assert results[prefix] == [word for word in self.vocabulary
+                                       if word.startswith(prefix)]
+
+    def test_iter_lines(self):
+        text = 'apple\r\n  banana \n\nch\u00e9rie\ndate'.encode('utf-8')
+        expected = ['apple', 'banana', 'ch\u00e9rie', 'date']
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'words.txt')
+            with open(filename, 'wb') as file:
+                file.write(text)
+            gzip_filename = filename + '.gz'
+            with gzip.open(gzip_filename, 'wb') as file:
+                file.write(text)
+            # Verify lines that span chunks are read whole
+            for chunk_size in [1, 3, 1 << 20]:
+                assert list(iter_lines(filename, chunk_size)) == expected
+                assert list(iter_lines(gzip_filename, chunk_size)) == expected
+            # Verify a line much longer than a chunk is read whole
+            with open(filename, 'wb') as file:
+                file.write(b'a' * 100 + b'\nbb\n' + b'c' * 50)
+            assert list(iter_lines(filename, 7)) == ['a' * 100, 'bb', 'c' * 50]
+
+    def test_load_prefix_tree(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'words.txt')
+            with open(filename, 'w') as file:
+                file.write('\n'.join(sorted(self.vocabulary)) + '\n')
+            reports = []
+            tree = load_prefix_tree(filename, progress=reports.append,
+                                    progress_interval=4)
+            assert reports == [4, 8, 9]
+            assert tree.size == len(self.vocabulary)
+            assert tree.complete('axlet') == ['axletree']
+            tree = load_prefix_tree(filename, sorted_input=True)
+            assert sorted(tree.strings()) == sorted(self.vocabulary)
+            # Verify progress is reported once at the end of an empty file
+            with open(filename, 'w') as file:
+                file.write('\n')
+            reports = []
+            tree = load_prefix_tree(filename, progress=reports.append,
+                                    progress_interval=4)
+            assert reports == [0]
+            assert tree.size == 0
+            with open(filename, 'w') as file:
+                file.write('\n'.join(self.vocabulary[:8]))
+            reports = []
+            load_prefix_tree(filename, progress=reports.append,
+                             progress_interval=4)
+            assert reports == [4, 8]
+
+    def test_unknown_algorithm(self):
+        with self.assertRaises(ValueError):
+            autocomplete_setup(self.vocabulary, 'hash_table')
+        with self.assertRaises(ValueError):
+            autocomplete('ax', self.vocabulary, 'hash_table')
+
+    def test_sorted_array_range(self):
+        words = sorted(self.vocabulary)
+        assert sorted_array_range('axle', words) == (2, 6)
+        assert sorted_array_range('', words) == (0, len(words))
+        assert sorted_array_range('c', words) == (8, 8)
+        assert sorted_array_range('zz', words) == (9, 9)
+        # Verify prefixes that end with the largest code point
+        end = chr(MAX_CODE_POINT)
+        words = ['a', 'a' + end, 'a' + end + 'b', 'b', end, end + end]
+        assert sorted_array_range('a' + end, words) == (1, 3)
+        assert sorted_array_range(end, words) == (4, 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
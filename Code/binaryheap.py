@@ -5,19 +5,41 @@ class BinaryMinHeap(object):
     """BinaryMinHeap: a partially ordered collection with efficient methods to
     insert new items in partial order and to access and remove its minimum item.
     Items are stored in a dynamic array that implicitly represents a complete
-    binary tree with root node at index 0 and last leaf node at index n-1."""
+    d-ary tree with root node at index 0 and last leaf node at index n-1, where
+    each node has d children: 2 by default, for a binary tree, or more for a
+    shallower tree that needs fewer levels of moves to delete its minimum item.
+    Items are ordered by a key function, or by their own values if it is None,
+    and each item's key is computed once and cached in a list parallel to the
+    items, which is the list of items itself while items are their own keys.
+    If reverse is True, the heap keeps the item with the maximum key at its
+    root, so the methods named for the minimum item act on the maximum."""
 
-    def __init__(self, items=None):
-        """Initialize this heap and insert the given items, if any."""
-        # Initialize an empty list to store the items
-        self.items = []
-        if items:
-            for item in items:
-                self.insert(item)
+    def __init__(self, items=None, d=2, key=None, reverse=False):
+        """Initialize this heap with the given number of children per node,
+        key function and order, and with the given items, if any, arranged in
+        heap order in linear time (see _heapify). Raise ValueError if d is not
+        an integer of at least 2."""
+        if not isinstance(d, int) or d < 2:
+            raise ValueError('Heap must have at least 2 children per node, '
+                             'not {!r}'.format(d))
+        self.d = d
+        self.key = key
+        self.reverse = reverse
+        # Initialize a list to store the items
+        self.items = list(items) if items is not None else []
+        # Initialize a list to store the keys of the items, which shares the
+        # list of items instead of copying it if items are their own keys
+        if key is None:
+            self.keys = self.items
+        else:
+            self.keys = [key(item) for item in self.items]
+        self._heapify()
 
     def __repr__(self):
         """Return a string representation of this heap."""
-        return 'BinaryMinHeap({})'.format(self.items)
+        if self.d == 2:
+            return 'BinaryMinHeap({})'.format(self.items)
+        return 'BinaryMinHeap({}, d={})'.format(self.items, self.d)
 
     def is_empty(self):
         """Return True if this heap is empty, or False otherwise."""
@@ -28,13 +50,27 @@ class BinaryMinHeap(object):
         return len(self.items)
 
     def insert(self, item):
-        """Insert the given item into this heap.
-        TODO: Best case running time: ??? under what conditions?
-        TODO: Worst case running time: ??? under what conditions?"""
+        """Insert the given item into this heap, ordered by its key.
+        Best case running time: O(1) if the item is not less than its parent.
+        Worst case running time: O(log_d n) if the item is less than the items
+        on the path up to the root node and must move to the root."""
         # Insert the item at the end and bubble up to the root
+        items = self.items
+        items.append(item)
+        if self.keys is not items:
+            self.keys.append(item if self.key is None else self.key(item))
+        self._bubble_up(len(items) - 1)
+
+    def insert_keyed(self, item, key):
+        """Insert the given item into this heap, ordered by the given key
+        instead of its key function, such as a priority.
+        Best case running time: O(1) if the item is not less than its parent.
+        Worst case running time: O(log_d n) if the item must move to the root."""
+        self._split_keys(item, key)
         self.items.append(item)
-        if self.size() > 1:
-            self._bubble_up(self._last_index())
+        if self.keys is not self.items:
+            self.keys.append(key)
+        self._bubble_up(len(self.items) - 1)
 
     def get_min(self):
         """Return the minimum item at the root of this heap.
@@ -44,87 +80,233 @@ class BinaryMinHeap(object):
         assert self.size() > 0
         return self.items[0]
 
+    def get_min_key(self):
+        """Return the key of the minimum item at the root of this heap, or
+        raise ValueError if this heap is empty."""
+        if self.size() == 0:
+            raise ValueError('Heap is empty and has no minimum item')
+        return self.keys[0]
+
     def delete_min(self):
         """Remove and return the minimum item at the root of this heap.
-        TODO: Best case running time: ??? under what conditions?
-        TODO: Worst case running time: ??? under what conditions?"""
-        if self.size() == 0:
+        Best case running time: O(1) if the last item moved to the root is not
+        greater than the root's children.
+        Worst case running time: O(d log_d n) if the last item moved to the
+        root must move down to a leaf, which it usually does as it came from
+        one, comparing its d children at each level."""
+        items = self.items
+        keys = self.keys
+        if len(items) == 0:
             raise ValueError('Heap is empty and has no minimum item')
-        elif self.size() == 1:
-            # Remove and return the only item
-            return self.items.pop()
-        assert self.size() > 1
-        min_item = self.items[0]
+        # Remove the last item, which is the minimum item if it is the only one
+        last_item = items.pop()
+        last_key = last_item if keys is items else keys.pop()
+        if len(items) == 0:
+            return last_item
+        min_item = items[0]
         # Move the last item to the root and bubble down to the leaves
-        last_item = self.items.pop()
-        self.items[0] = last_item
-        
+        items[0] = last_item
+        keys[0] = last_key
         self._bubble_down(0)
         return min_item
 
+    def delete_min_many(self, count):
+        """Remove and return a list of the count minimum items of this heap in
+        sorted order, or of all its items if it has fewer than count items, or
+        raise ValueError if count is negative.
+        This method is more efficient than calling delete_min count times.
+        Running time: O(k d log_d n) to delete k items one at a time, but only
+        O(n log n) with a single sort if all n items are deleted."""
+        if count < 0:
+            raise ValueError('Cannot delete {} items from heap'.format(count))
+        items = self.items
+        keys = self.keys
+        if count >= len(items):
+            # Sorting all items at once is faster than deleting them in turn
+            self.items = []
+            self.keys = self.items if self.key is None else []
+            if keys is items:
+                items.sort(reverse=self.reverse)
+                return items
+            order = sorted(range(len(items)), key=keys.__getitem__,
+                           reverse=self.reverse)
+            return [items[index] for index in order]
+        min_items = []
+        for _ in range(count):
+            min_items.append(items[0])
+            items[0] = items.pop()
+            if keys is not items:
+                keys[0] = keys.pop()
+            self._bubble_down(0)
+        return min_items
+
     def replace_min(self, item):
         """Remove and return the minimum item at the root of this heap,
         and insert the given item into this heap.
         This method is more efficient than calling delete_min and then insert.
-        TODO: Best case running time: ??? under what conditions?
-        TODO: Worst case running time: ??? under what conditions?"""
+        Best case running time: O(1) if the item is not greater than the
+        root's children.
+        Worst case running time: O(d log_d n) if the item must move down to a
+        leaf node."""
+        return self.replace_min_keyed(
+            item, item if self.key is None else self.key(item))
+
+    def replace_min_keyed(self, item, key):
+        """Remove and return the minimum item at the root of this heap, and
+        insert the given item ordered by the given key, or raise ValueError if
+        this heap is empty (see replace_min)."""
         if self.size() == 0:
             raise ValueError('Heap is empty and has no minimum item')
-        assert self.size() > 0
+        self._split_keys(item, key)
         min_item = self.items[0]
         # Replace the root and bubble down to the leaves
         self.items[0] = item
-        if self.size() > 1:
-            self._bubble_down(0)
+        self.keys[0] = key
+        self._bubble_down(0)
         return min_item
 
+    def _split_keys(self, item, key):
+        """Copy the list of keys apart from the list of items if they share it
+        and the given item is given a key other than itself."""
+        if self.keys is self.items and key is not item:
+            self.keys = list(self.items)
+
     def _bubble_up(self, index):
         """Ensure the heap ordering property is true above the given index,
-        swapping out of order items, or until the root node is reached.
+        moving parent items that belong below the item down into the hole left
+        by it, or until the root node is reached, then writing the item once
+        into the hole. This needs one write per level instead of a swap.
+        Return the index where the item is written.
         Best case running time: O(1) if parent item is smaller than this item.
-        Worst case running time: O(log n) if items on path up to root node are
-        out of order. Maximum path length in complete binary tree is log n."""
+        Worst case running time: O(log_d n) if items on path up to root node
+        are out of order. Maximum path length in a complete d-ary tree is
+        log_d n."""
         if index == 0:
-            return  # This index is the root node (does not have a parent)
-        if not (0 <= index <= self._last_index()):
+            return 0  # This index is the root node (does not have a parent)
+        items = self.items
+        keys = self.keys
+        if not (0 <= index < len(items)):
             raise IndexError('Invalid index: {}'.format(index))
-        # Get the item's value
-        item = self.items[index]
-        # Get the parent's index and value
-        parent_index = self._parent_index(index)
-        parent_item = self.items[parent_index]
-        # Swap this item with parent item if values are out of order
-        if parent_index >= 0 and parent_item > item:
-            self.items[index], self.items[parent_index] = self.items[parent_index], self.items[index]
-            self._bubble_up(parent_index)        
-       
+        item = items[index]
+        reverse = self.reverse
+        d = self.d
+        if keys is items and d == 2 and not reverse:
+            # Move items of a binary min heap of items without keys or options
+            while index > 0:
+                parent_index = (index - 1) >> 1
+                parent_item = items[parent_index]
+                # Stop once the parent item is in order with this item
+                if not parent_item > item:
+                    break
+                items[index] = parent_item
+                index = parent_index
+            items[index] = item
+            return index
+        # Keys are written separately only if they are not the items
+        split = keys is not items
+        key = keys[index]
+        while index > 0:
+            parent_index = (index - 1) // d
+            parent_key = keys[parent_index]
+            # Stop once the parent item is in order with this item; the
+            # comparison is inline rather than through a function for speed
+            if not (key > parent_key if reverse else key < parent_key):
+                break
+            items[index] = items[parent_index]
+            if split:
+                keys[index] = parent_key
+            index = parent_index
+        items[index] = item
+        keys[index] = key
+        return index
 
     def _bubble_down(self, index):
         """Ensure the heap ordering property is true below the given index,
-        swapping out of order items, or until a leaf node is reached.
-        Best case running time: O(1) if item is smaller than both child items.
-        Worst case running time: O(log n) if items on path down to a leaf are
-        out of order. Maximum path length in complete binary tree is log n."""
-        if not (0 <= index <= self._last_index()):
+        moving the smallest child item up into the hole left by the item while
+        it is smaller than the item, or until a leaf node is reached, then
+        writing the item once into the hole. Return the index where the item
+        is written.
+        Best case running time: O(d) if item is smaller than its child items.
+        Worst case running time: O(d log_d n) if items on path down to a leaf
+        are out of order, comparing d child items at each level."""
+        items = self.items
+        keys = self.keys
+        size = len(items)
+        if not (0 <= index < size):
             raise IndexError('Invalid index: {}'.format(index))
-        # Get the index of the item's left and right children
-        left_index = self._left_child_index(index)
-        right_index = self._right_child_index(index)
-        if left_index > self._last_index():
-            return  # This index is a leaf node (does not have any children)
-        # Get the item's value
-        item = self.items[index]
-        # Determine which child item to compare this node's item to
-        child_index = left_index
-        if right_index <= self._last_index() and self.items[right_index] < self.items[left_index]:
-            child_index = right_index
-
-        # Swap this item with a child item if values are out of order
-        child_item = self.items[child_index]
-        if item > child_item:
-            self.items[index], self.items[child_index] = self.items[child_index], self.items[index]
-            self._bubble_down(child_index)
-        
+        item = items[index]
+        reverse = self.reverse
+        d = self.d
+        if keys is items and d == 2 and not reverse:
+            # Move items of a binary min heap of items without keys or options
+            child_index = (index << 1) + 1
+            while child_index < size:
+                # Determine which child item to compare this node's item to
+                right_index = child_index + 1
+                if (right_index < size and
+                        items[right_index] < items[child_index]):
+                    child_index = right_index
+                child_item = items[child_index]
+                # Stop once this item is in order with the smaller child item
+                if not item > child_item:
+                    break
+                items[index] = child_item
+                index = child_index
+                child_index = (index << 1) + 1
+            items[index] = item
+            return index
+        # Keys are written separately only if they are not the items
+        split = keys is not items
+        key = keys[index]
+        child_index = index * d + 1
+        while child_index < size:
+            # Determine which child item to compare this node's item to
+            child_key = keys[child_index]
+            if d == 2:
+                # Compare the only sibling directly, which is faster than a
+                # loop over one sibling
+                right_index = child_index + 1
+                if right_index < size:
+                    right_key = keys[right_index]
+                    if (right_key > child_key if reverse
+                            else right_key < child_key):
+                        child_index = right_index
+                        child_key = right_key
+            else:
+                # Compare each sibling to the smallest child item so far
+                sibling_index = child_index + 1
+                last_index = child_index + d
+                if last_index > size:
+                    last_index = size
+                while sibling_index < last_index:
+                    sibling_key = keys[sibling_index]
+                    if (sibling_key > child_key if reverse
+                            else sibling_key < child_key):
+                        child_index = sibling_index
+                        child_key = sibling_key
+                    sibling_index += 1
+            # Stop once this item is in order with the smallest child item
+            if not (child_key > key if reverse else child_key < key):
+                break
+            items[index] = items[child_index]
+            if split:
+                keys[index] = child_key
+            index = child_index
+            child_index = index * d + 1
+        items[index] = item
+        keys[index] = key
+        return index
+
+    def _heapify(self):
+        """Rearrange the items of this heap to satisfy the heap ordering
+        property, bubbling down each item that has children from the last one
+        up to the root, so each subtree is a heap before its root is placed.
+        Running time: O(n) because half of the items are leaves that do not
+        move, a quarter move down at most one level, an eighth at most two, and
+        so on, which sums to less than n levels in total (Floyd's method),
+        unlike O(n log n) to insert the items one at a time."""
+        for index in range((len(self.items) - 2) // self.d, -1, -1):
+            self._bubble_down(index)
 
     def _last_index(self):
         """Return the last valid index in the underlying array of items."""
@@ -134,25 +316,184 @@ class BinaryMinHeap(object):
         """Return the parent index of the item at the given index."""
         if index <= 0:
             raise IndexError('Heap index {} has no parent index'.format(index))
-        return (index - 1) >> 1  # Shift right to divide by 2
+        return (index - 1) // self.d
 
     def _left_child_index(self, index):
-        """Return the left child index of the item at the given index."""
-        return (index << 1) + 1  # Shift left to multiply by 2
+        """Return the index of the first (left) child of the item at the given
+        index."""
+        return index * self.d + 1
 
     def _right_child_index(self, index):
-        """Return the right child index of the item at the given index."""
-        return (index << 1) + 2  # Shift left to multiply by 2
+        """Return the index of the last (right) child of the item at the given
+        index."""
+        return index * self.d + self.d
 
     def heapify(self, array):
-        """Given an array, returns the array satisfying the heap requirements"""
-        return BinaryMinHeap(array).items
+        """Replace the items of this heap with the items of the given array,
+        rearranged to satisfy the heap ordering property in O(n) time, and
+        return the list of items."""
+        self.items = list(array)
+        if self.key is None:
+            self.keys = self.items
+        else:
+            self.keys = [self.key(item) for item in self.items]
+        self._heapify()
+        return self.items
+
+
+class IndexedBinaryMinHeap(BinaryMinHeap):
+    """IndexedBinaryMinHeap: a BinaryMinHeap that also maps each item to its
+    index in the array of items, so it can find any item in O(1) time and
+    change its key or delete it in O(log n) time instead of searching for it
+    in O(n). Items must be hashable and each item can be stored only once."""
+
+    def __init__(self, items=None, d=2, key=None, reverse=False):
+        """Initialize this heap like a BinaryMinHeap, or raise ValueError if
+        the given items contain duplicates."""
+        # Map each item to its index in the array of items
+        self.positions = {}
+        super().__init__(items, d, key, reverse)
+
+    def __repr__(self):
+        """Return a string representation of this heap."""
+        return 'IndexedBinaryMinHeap({}, d={})'.format(self.items, self.d)
+
+    def contains(self, item):
+        """Return True if this heap contains the given item.
+        Running time: O(1) to look the item up in the map of indexes."""
+        return item in self.positions
+
+    def get_key(self, item):
+        """Return the key of the given item, or raise ValueError if this heap
+        does not contain it."""
+        if item not in self.positions:
+            raise ValueError('Item not found in heap: {!r}'.format(item))
+        return self.keys[self.positions[item]]
+
+    def insert(self, item):
+        """Insert the given item into this heap ordered by its key, or raise
+        ValueError if this heap already contains it."""
+        if item in self.positions:
+            raise ValueError('Item already in heap: {!r}'.format(item))
+        super().insert(item)
+
+    def insert_keyed(self, item, key):
+        """Insert the given item into this heap ordered by the given key, or
+        raise ValueError if this heap already contains it."""
+        if item in self.positions:
+            raise ValueError('Item already in heap: {!r}'.format(item))
+        super().insert_keyed(item, key)
+
+    def delete_min(self):
+        """Remove and return the minimum item at the root of this heap, or
+        raise ValueError if this heap is empty."""
+        min_item = super().delete_min()
+        del self.positions[min_item]
+        return min_item
+
+    def delete_min_many(self, count):
+        """Remove and return a list of the count minimum items of this heap in
+        sorted order (see BinaryMinHeap.delete_min_many)."""
+        if count < 0:
+            raise ValueError('Cannot delete {} items from heap'.format(count))
+        if count >= self.size():
+            self.positions = {}
+            return super().delete_min_many(count)
+        return [self.delete_min() for _ in range(count)]
+
+    def replace_min_keyed(self, item, key):
+        """Remove and return the minimum item at the root of this heap, and
+        insert the given item ordered by the given key, or raise ValueError if
+        this heap is empty or already contains the given item."""
+        if item in self.positions:
+            raise ValueError('Item already in heap: {!r}'.format(item))
+        min_item = self.get_min()
+        del self.positions[min_item]
+        return super().replace_min_keyed(item, key)
+
+    def update_key(self, item, key):
+        """Change the key of the given item and move it to restore the heap
+        ordering property, or raise ValueError if this heap does not contain
+        the item.
+        Running time: O(log_d n) to move the item up, or O(d log_d n) down."""
+        if item not in self.positions:
+            raise ValueError('Item not found in heap: {!r}'.format(item))
+        self._split_keys(item, key)
+        index = self.positions[item]
+        self.keys[index] = key
+        # The item moves up if it is now smaller than its parent, and
+        # otherwise it may move down
+        if self._bubble_up(index) == index:
+            self._bubble_down(index)
+
+    def delete(self, item):
+        """Remove the given item from this heap and return its key, or raise
+        ValueError if this heap does not contain the item.
+        Running time: O(d log_d n) if the last item, moved into the deleted
+        item's place, must move down to a leaf."""
+        if item not in self.positions:
+            raise ValueError('Item not found in heap: {!r}'.format(item))
+        items = self.items
+        keys = self.keys
+        index = self.positions.pop(item)
+        key = keys[index]
+        # Move the last item into the hole left by the deleted item
+        last_item = items.pop()
+        last_key = last_item if keys is items else keys.pop()
+        if index < len(items):
+            items[index] = last_item
+            keys[index] = last_key
+            self.positions[last_item] = index
+            if self._bubble_up(index) == index:
+                self._bubble_down(index)
+        return key
+
+    def _bubble_up(self, index):
+        """Bubble up the item at the given index like BinaryMinHeap._bubble_up
+        and update the indexes of the items it moved past, which are the items
+        along the path from its new index down to its old index."""
+        start = index
+        index = super()._bubble_up(index)
+        items = self.items
+        positions = self.positions
+        d = self.d
+        while start != index:
+            positions[items[start]] = start
+            start = (start - 1) // d
+        positions[items[index]] = index
+        return index
+
+    def _bubble_down(self, index):
+        """Bubble down the item at the given index like
+        BinaryMinHeap._bubble_down and update the indexes of the items it moved
+        past, which are the items along the path from its new index up to its
+        old index."""
+        start = index
+        end = super()._bubble_down(index)
+        items = self.items
+        positions = self.positions
+        d = self.d
+        index = end
+        while index != start:
+            positions[items[index]] = index
+            index = (index - 1) // d
+        positions[items[start]] = start
+        return end
+
+    def _heapify(self):
+        """Map each item to its index, or raise ValueError if the items contain
+        duplicates, then rearrange the items like BinaryMinHeap._heapify."""
+        self.positions = {item: index for index, item in enumerate(self.items)}
+        if len(self.positions) < len(self.items):
+            raise ValueError('Items in heap must be unique')
+        super()._heapify()
+
 
 def heapSort(items):
     """Sorts a list of given items using a MinHeap Data structure. mutates the given array
     Time Complexity:
-        O(nlogn) - for every item removed from the top of the heap, the replaced item must bubble down to its appropriate
-                        spot to satisfy the minHeap methods.
+        O(nlogn) - building the heap takes O(n), then for every item removed from the top of the heap, the replaced
+                        item must bubble down to its appropriate spot to satisfy the minHeap methods.
     Space Complexity:
         O(n) - creates a new heap of size n items
     Args:
@@ -167,9 +508,8 @@ def heapSort(items):
         index += 1
 
 def heapify(items):
-    """Returns an array that satisfies the heap attributes"""
-    items = BinaryMinHeap(items)
-    return items
+    """Returns a heap of the given items, built in O(n) time"""
+    return BinaryMinHeap(items)
 
 def test_binary_min_heap():
     # Create a binary min heap of 7 items
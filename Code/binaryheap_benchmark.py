@@ -0,0 +1,151 @@
+#!python3
+
+from binaryheap import BinaryMinHeap
+import argparse
+import heapq
+import random
+import time
+
+
+class LegacyBinaryMinHeap(BinaryMinHeap):
+    """LegacyBinaryMinHeap: A BinaryMinHeap with the previous recursive
+    bubble methods, which checked the index against _last_index and swapped a
+    pair of items at every level. It is kept here only as a baseline to
+    compare BinaryMinHeap against."""
+
+    def insert(self, item):
+        self.items.append(item)
+        if self.size() > 1:
+            self._bubble_up(self._last_index())
+
+    def delete_min(self):
+        if self.size() == 0:
+            raise ValueError('Heap is empty and has no minimum item')
+        elif self.size() == 1:
+            return self.items.pop()
+        min_item = self.items[0]
+        self.items[0] = self.items.pop()
+        self._bubble_down(0)
+        return min_item
+
+    def _bubble_up(self, index):
+        if index == 0:
+            return
+        if not (0 <= index <= self._last_index()):
+            raise IndexError('Invalid index: {}'.format(index))
+        item = self.items[index]
+        parent_index = self._parent_index(index)
+        parent_item = self.items[parent_index]
+        if parent_index >= 0 and parent_item > item:
+            self.items[index], self.items[parent_index] = \
+                self.items[parent_index], self.items[index]
+            self._bubble_up(parent_index)
+
+    def _bubble_down(self, index):
+        if not (0 <= index <= self._last_index()):
+            raise IndexError('Invalid index: {}'.format(index))
+        left_index = self._left_child_index(index)
+        right_index = self._right_child_index(index)
+        if left_index > self._last_index():
+            return
+        item = self.items[index]
+        child_index = left_index
+        if (right_index <= self._last_index() and
+                self.items[right_index] < self.items[left_index]):
+            child_index = right_index
+        child_item = self.items[child_index]
+        if item > child_item:
+            self.items[index], self.items[child_index] = \
+                self.items[child_index], self.items[index]
+            self._bubble_down(child_index)
+
+
+def measure(heap_class, items):
+    """Return the seconds to insert the given items one at a time into an
+    empty heap of the given class, and to delete them all one at a time."""
+    heap = heap_class()
+    start_time = time.perf_counter()
+    for item in items:
+        heap.insert(item)
+    insert_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    for _ in range(len(items)):
+        heap.delete_min()
+    delete_time = time.perf_counter() - start_time
+    return insert_time, delete_time
+
+
+def measure_heapq(items):
+    """Return the seconds to push and pop the given items with heapq, whose
+    C implementation bounds how fast a heap can be in Python."""
+    heap = []
+    start_time = time.perf_counter()
+    for item in items:
+        heapq.heappush(heap, item)
+    insert_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    for _ in range(len(items)):
+        heapq.heappop(heap)
+    delete_time = time.perf_counter() - start_time
+    return insert_time, delete_time
+
+
+def measure_keyed(heap, priorities, pairs=False):
+    """Return the seconds to insert an item with each of the given priorities
+    into the given empty heap, and to delete them all one at a time. If pairs
+    is True, the heap stores (priority, item) pairs, as PriorityQueue used to,
+    and otherwise it stores items keyed by priorities."""
+    if pairs:
+        def insert(item, priority):
+            heap.insert((priority, item))
+    else:
+        insert = heap.insert_keyed
+    delete = heap.delete_min
+    start_time = time.perf_counter()
+    for item, priority in enumerate(priorities):
+        insert(item, priority)
+    insert_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    for _ in range(len(priorities)):
+        delete()
+    delete_time = time.perf_counter() - start_time
+    return insert_time, delete_time
+
+
+def main():
+    """Read command-line arguments and compare inserting and deleting items
+    with BinaryMinHeap, the previous recursive heap, and heapq, and items
+    with priorities with BinaryMinHeap of several numbers of children."""
+    parser = argparse.ArgumentParser(
+        description='Compare BinaryMinHeap with the previous recursive heap.')
+    parser.add_argument('--size', type=int, default=200000,
+                        help='number of items to insert and delete')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    items = [rng.random() for _ in range(args.size)]
+    for name, insert_time, delete_time in (
+            ('legacy', *measure(LegacyBinaryMinHeap, items)),
+            ('binary', *measure(BinaryMinHeap, items)),
+            ('heapq', *measure_heapq(items))):
+        print('{:>6}: insert {:.3f} sec, delete_min {:.3f} sec'
+              .format(name, insert_time, delete_time))
+
+    print('Items with priorities:')
+    print('{:>6}: insert {:.3f} sec, delete {:.3f} sec'
+          .format('pairs', *measure_keyed(BinaryMinHeap(), items, True)))
+    for d in (2, 3, 4, 8):
+        print('{:>6}: insert {:.3f} sec, delete {:.3f} sec'
+              .format('{}-ary'.format(d),
+                      *measure_keyed(BinaryMinHeap(d=d), items)))
+
+    heap = BinaryMinHeap(items)
+    start_time = time.perf_counter()
+    heap.delete_min_many(args.size // 2)
+    print('delete_min_many of half the items: {:.3f} sec'
+          .format(time.perf_counter() - start_time))
+
+
+if __name__ == '__main__':
+    main()
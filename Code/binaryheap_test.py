@@ -1,6 +1,6 @@
 #!python
 
-from binaryheap import BinaryMinHeap, heapSort
+from binaryheap import BinaryMinHeap, IndexedBinaryMinHeap, heapSort
 import random
 import unittest
 
@@ -78,6 +78,47 @@ class TestBinaryMinHeap(unittest.TestCase):
             assert min_item == item
         assert heap.size() == 0
 
+    def test_init_with_many_random_items(self):
+        items = random.sample(range(1000), 50)
+        heap = BinaryMinHeap(items)
+        assert heap.size() == len(items)
+        # Verify every item is not less than its parent item
+        for index in range(1, heap.size()):
+            assert heap.items[heap._parent_index(index)] <= heap.items[index]
+        # Verify the given list is not rearranged
+        assert heap.items is not items
+        for item in sorted(items):
+            assert heap.delete_min() == item
+        assert heap.size() == 0
+
+    def test_heapify(self):
+        heap = BinaryMinHeap([1, 2])
+        items = [9, 25, 86, 3, 29, 5, 55]
+        assert heap.heapify(items) == [3, 9, 5, 25, 29, 86, 55]
+        assert heap.size() == len(items)
+        assert heap.get_min() == 3
+
+    def test_delete_min_many(self):
+        items = random.sample(range(1000), 50)
+        heap = BinaryMinHeap(items)
+        with self.assertRaises(ValueError):
+            heap.delete_min_many(-1)
+        assert heap.delete_min_many(0) == []
+        assert heap.delete_min_many(20) == sorted(items)[:20]
+        assert heap.size() == 30
+        assert heap.get_min() == sorted(items)[20]
+        # Verify asking for more items than the heap has returns all of them
+        assert heap.delete_min_many(40) == sorted(items)[20:]
+        assert heap.size() == 0
+        assert heap.delete_min_many(1) == []
+
+    def test_bubble_with_invalid_index(self):
+        heap = BinaryMinHeap([5, 3])
+        with self.assertRaises(IndexError):
+            heap._bubble_up(2)
+        with self.assertRaises(IndexError):
+            heap._bubble_down(-1)
+
     def test_parent_index(self):
         heap = BinaryMinHeap()
         with self.assertRaises(IndexError):
@@ -114,6 +155,221 @@ class TestBinaryMinHeap(unittest.TestCase):
         assert heap._left_child_index(6) == 13
         assert heap._right_child_index(6) == 14
 
+
+class TestBinaryMinHeapOptions(unittest.TestCase):
+    def test_init_with_invalid_d(self):
+        with self.assertRaises(ValueError):
+            BinaryMinHeap(d=1)
+        with self.assertRaises(ValueError):
+            BinaryMinHeap(d=2.0)
+
+    def test_get_min_key_and_replace_min_on_empty_heap(self):
+        heap = BinaryMinHeap()
+        with self.assertRaises(ValueError):
+            heap.get_min_key()
+        with self.assertRaises(ValueError):
+            heap.replace_min(5)
+
+    def test_insert_and_delete_many_random_items(self):
+        items = random.sample(range(1000), 100)
+        for d in (2, 3, 4, 8):
+            heap = BinaryMinHeap(d=d)
+            for index, item in enumerate(items):
+                heap.insert(item)
+                assert heap.size() == index + 1
+                assert heap.get_min() == min(items[: index + 1])
+            for item in sorted(items):
+                assert heap.delete_min() == item
+            assert heap.is_empty() is True
+
+    def test_init_with_many_random_items(self):
+        items = random.sample(range(1000), 100)
+        for d in (2, 3, 4, 8):
+            heap = BinaryMinHeap(items, d=d)
+            # Verify every item is not less than its parent item
+            for index in range(1, heap.size()):
+                assert heap.items[(index - 1) // d] <= heap.items[index]
+            assert [heap.delete_min() for _ in items] == sorted(items)
+
+    def test_reverse(self):
+        items = random.sample(range(1000), 100)
+        for d in (2, 4):
+            heap = BinaryMinHeap(items[:50], d=d, reverse=True)
+            for item in items[50:]:
+                heap.insert(item)
+            assert heap.get_min() == max(items)
+            assert [heap.delete_min() for _ in items] == \
+                sorted(items, reverse=True)
+
+    def test_key(self):
+        words = ['pear', 'fig', 'banana', 'kiwi', 'apple', 'cherry']
+        heap = BinaryMinHeap(words, d=4, key=len)
+        # Verify keys are computed once and cached alongside items
+        assert sorted(heap.keys) == sorted(map(len, words))
+        assert heap.get_min() == 'fig'
+        assert heap.get_min_key() == 3
+        heap.insert('ox')
+        assert heap.get_min() == 'ox'
+        lengths = [len(heap.delete_min()) for _ in range(heap.size())]
+        assert lengths == [2, 3, 4, 4, 5, 6, 6]
+
+    def test_insert_keyed_and_replace_min(self):
+        heap = BinaryMinHeap(d=4)
+        # Verify items are ordered by given keys and are never compared
+        for priority, name in [(3, 'c'), (1, 'a'), (2, 'b'), (1, 'e')]:
+            heap.insert_keyed({'name': name}, priority)
+        assert heap.get_min_key() == 1
+        assert heap.replace_min_keyed({'name': 'd'}, 4)['name'] in 'ae'
+        assert heap.get_min_key() == 1
+        assert [heap.delete_min()['name'] for _ in range(4)][1:] == \
+            ['b', 'c', 'd']
+        heap = BinaryMinHeap([5, 3, 8])
+        assert heap.replace_min(9) == 3
+        assert heap.get_min() == 5
+
+    def test_keys_share_items_until_keyed(self):
+        heap = BinaryMinHeap([5, 3, 8], d=4)
+        # Verify items that are their own keys are not copied into keys
+        assert heap.keys is heap.items
+        heap.insert(1)
+        assert heap.delete_min() == 1
+        assert heap.keys is heap.items
+        # Verify the first item keyed apart from itself copies the keys
+        heap.insert_keyed('x', 4)
+        assert heap.keys is not heap.items
+        assert heap.keys == [3, 5, 8, 4]
+        assert [heap.delete_min() for _ in range(4)] == [3, 'x', 5, 8]
+        assert heap.keys == heap.items == []
+
+    def test_delete_min_many_with_options(self):
+        words = ['pear', 'fig', 'banana', 'kiwi', 'apple', 'cherry']
+        heap = BinaryMinHeap(words, d=3, key=len, reverse=True)
+        assert len(heap.delete_min_many(1)[0]) == 6
+        assert [len(word) for word in heap.delete_min_many(10)] == \
+            [6, 5, 4, 4, 3]
+        assert heap.keys == heap.items == []
+        items = random.sample(range(1000), 50)
+        heap = BinaryMinHeap(items, d=4, reverse=True)
+        assert heap.delete_min_many(20) == sorted(items, reverse=True)[:20]
+        assert heap.delete_min_many(30) == sorted(items, reverse=True)[20:]
+
+    def test_insert_after_delete_min_many_of_all_items(self):
+        heap = BinaryMinHeap([1, 2], key=lambda item: -item)
+        assert heap.delete_min_many(5) == [2, 1]
+        # Verify keys are still computed after the heap is drained
+        for item in (1, 2, 3):
+            heap.insert(item)
+        assert heap.keys == [-item for item in heap.items]
+        assert heap.get_min() == 3
+        heap = BinaryMinHeap([5, 1, 4], d=3, reverse=True)
+        assert heap.delete_min_many(3) == [5, 4, 1]
+        for item in (2, 7, 3):
+            heap.insert(item)
+        assert [heap.delete_min() for _ in range(3)] == [7, 3, 2]
+
+    def test_heapify_with_key(self):
+        heap = BinaryMinHeap(d=3, key=abs)
+        assert sorted(heap.heapify([-5, 2, -1, 4])) == [-5, -1, 2, 4]
+        assert heap.keys == [abs(item) for item in heap.items]
+        assert heap.get_min() == -1
+
+    def test_child_index(self):
+        heap = BinaryMinHeap(d=4)
+        assert heap._left_child_index(0) == 1
+        assert heap._right_child_index(0) == 4
+        assert heap._left_child_index(2) == 9
+        assert heap._right_child_index(2) == 12
+        assert heap._parent_index(4) == 0
+        assert heap._parent_index(9) == 2
+
+
+class TestIndexedBinaryMinHeap(unittest.TestCase):
+    def assert_valid(self, heap):
+        # Verify heap order and that every item is mapped to its index
+        for index in range(1, heap.size()):
+            assert heap.keys[(index - 1) // heap.d] <= heap.keys[index]
+        assert heap.positions == {item: index
+                                  for index, item in enumerate(heap.items)}
+
+    def assert_valid_reverse(self, heap):
+        # Verify reversed heap order and that every item is mapped to its index
+        for index in range(1, heap.size()):
+            assert heap.keys[(index - 1) // heap.d] >= heap.keys[index]
+        assert heap.positions == {item: index
+                                  for index, item in enumerate(heap.items)}
+
+    def test_init_with_duplicate_items(self):
+        with self.assertRaises(ValueError):
+            IndexedBinaryMinHeap([3, 1, 3])
+
+    def test_insert_and_delete_min(self):
+        items = random.sample(range(1000), 100)
+        heap = IndexedBinaryMinHeap(items[:50], d=4)
+        self.assert_valid(heap)
+        for item in items[50:]:
+            heap.insert(item)
+        self.assert_valid(heap)
+        assert heap.contains(items[0]) is True
+        with self.assertRaises(ValueError):
+            heap.insert(items[0])
+        for item in sorted(items)[:50]:
+            assert heap.delete_min() == item
+            assert heap.contains(item) is False
+        self.assert_valid(heap)
+        with self.assertRaises(ValueError):
+            heap.replace_min(sorted(items)[60])
+        assert heap.replace_min(-1) == sorted(items)[50]
+        assert heap.get_min() == -1
+        self.assert_valid(heap)
+
+    def test_insert_after_delete_min_many_of_all_items(self):
+        heap = IndexedBinaryMinHeap(['a', 'bb', 'ccc'], key=len, reverse=True)
+        assert heap.delete_min_many(3) == ['ccc', 'bb', 'a']
+        assert heap.positions == {}
+        for item in ('dd', 'e', 'fff'):
+            heap.insert(item)
+        self.assert_valid_reverse(heap)
+        assert heap.get_min() == 'fff'
+        assert [heap.delete_min() for _ in range(3)] == ['fff', 'dd', 'e']
+
+    def test_update_key_and_delete(self):
+        for d in (2, 3, 4):
+            heap = IndexedBinaryMinHeap(d=d)
+            keys = {}
+            for item in range(100):
+                keys[item] = random.randrange(1000)
+                heap.insert_keyed(item, keys[item])
+            for item in random.sample(range(100), 50):
+                keys[item] = random.randrange(1000)
+                heap.update_key(item, keys[item])
+                assert heap.get_key(item) == keys[item]
+            self.assert_valid(heap)
+            for item in random.sample(range(100), 50):
+                assert heap.delete(item) == keys.pop(item)
+                assert heap.contains(item) is False
+            self.assert_valid(heap)
+            with self.assertRaises(ValueError):
+                heap.delete(-1)
+            with self.assertRaises(ValueError):
+                heap.update_key(-1, 0)
+            with self.assertRaises(ValueError):
+                heap.get_key(-1)
+            # Verify the remaining items come out in order of their keys
+            ordered = [heap.delete_min() for _ in range(heap.size())]
+            assert [keys[item] for item in ordered] == sorted(keys.values())
+            assert heap.positions == {}
+
+    def test_reverse(self):
+        heap = IndexedBinaryMinHeap(['a', 'b', 'c'], key=ord, reverse=True)
+        assert heap.get_min() == 'c'
+        heap.update_key('a', 1000)
+        assert heap.get_min() == 'a'
+        heap.delete('a')
+        assert heap.get_min() == 'c'
+        assert heap.positions == {'b': heap.items.index('b'),
+                                  'c': heap.items.index('c')}
+
+
 class TestHeapSort():
     def test_sort_with_random_numbers(self):
         items = random.sample(range(1000), 100)
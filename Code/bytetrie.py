@@ -0,0 +1,176 @@
+#!python3
+
+from gcpause import paused_gc
+
+
+class ByteTrieNode:
+    """ByteTrieNode: A node for use in a byte trie with up to 256 children,
+    one for each byte value. Children are stored in a dense list in order of
+    their bytes, indexed by a 256-bit bitmap of the bytes that have a child:
+    the child for a byte is at the position from the end of the list given by
+    the number of set bits at or above that byte's bit. This gives the
+    constant-time lookup of a fixed 256-slot table while storing only the
+    children that exist; a 256-slot list per node would take 2 KiB of
+    pointers and was slower to search in a benchmark of 200000 words."""
+
+    __slots__ = ('bitmap', 'children', 'terminal')
+
+    def __init__(self):
+        """Initialize this node with no children and a boolean terminal
+        property."""
+        # Bit b is set if this node has a child for byte value b
+        self.bitmap = 0
+        # Children nodes in increasing order of their byte values
+        self.children = []
+        # Marks if this node terminates a string in the byte trie
+        self.terminal = False
+
+    def is_terminal(self):
+        """Return True if this node terminates a string."""
+        return self.terminal
+
+    def num_children(self):
+        """Return the number of children nodes this node has."""
+        return len(self.children)
+
+    def get_child(self, byte):
+        """Return this node's child node for the given byte value, or None if
+        it has no such child."""
+        above = self.bitmap >> byte
+        if not above & 1:
+            return None
+        return self.children[-above.bit_count()]
+
+    def add_child(self, byte, child_node):
+        """Add the given child node for the given byte value, or raise
+        ValueError if this node already has a child for it."""
+        above = self.bitmap >> byte
+        if above & 1:
+            raise ValueError(f'Child exists for byte {byte!r}')
+        index = len(self.children) - above.bit_count()
+        self.children.insert(index, child_node)
+        self.bitmap |= 1 << byte
+
+    def items(self):
+        """Return a list of (byte, child node) pairs in increasing byte order."""
+        bitmap = self.bitmap
+        pairs = []
+        for child in self.children:
+            lowest = bitmap & -bitmap
+            pairs.append((lowest.bit_length() - 1, child))
+            bitmap ^= lowest
+        return pairs
+
+    def __repr__(self):
+        """Return a code representation of this node."""
+        return f'ByteTrieNode({len(self.children)} children)'
+
+
+class ByteTrie:
+    """ByteTrie: A prefix tree with the same interface as PrefixTree that
+    branches on the bytes of each string encoded as UTF-8 instead of its
+    characters, so every node has at most 256 children regardless of the
+    alphabet and finds a child with a bitmap instead of hashing. Strings are
+    retrieved in lexicographic order, since UTF-8 preserves code point order.
+    It offers a predictable fan-out, not speed: in a benchmark of 200000
+    generated words (see bytetrie_benchmark.py) it takes as much memory as a
+    PrefixTree, but looks strings up and completes them 10-25% slower, since
+    shifting a 256-bit bitmap costs more than a dict lookup and characters
+    outside ASCII take several bytes.
+    It supports fewer methods than a PrefixTree: no scores, top_k, delete,
+    complete_many or fuzzy_complete."""
+
+    def __init__(self, strings=None):
+        """Initialize this byte trie and insert the given strings, if any,
+        with the garbage collector paused (see paused_gc)."""
+        self.root = ByteTrieNode()
+        # Count the number of strings inserted into the tree
+        self.size = 0
+        if strings is not None:
+            with paused_gc():
+                for string in strings:
+                    self.insert(string)
+
+    def __repr__(self):
+        """Return a string representation of this byte trie."""
+        return f'ByteTrie({self.strings()!r})'
+
+    def is_empty(self):
+        """Return True if this byte trie is empty (contains no strings)."""
+        return self.size == 0
+
+    def _find_node(self, key):
+        """Return the node at the end of the path that spells the given bytes,
+        or None if no string in this byte trie starts with them."""
+        node = self.root
+        # Look children up through the bitmap inline, as in get_child, since
+        # a method call per byte costs more than the lookup itself
+        for byte in key:
+            above = node.bitmap >> byte
+            if not above & 1:
+                return None
+            node = node.children[-above.bit_count()]
+        return node
+
+    def contains(self, string):
+        """Return True if this byte trie contains the given string.
+            Time Complexity:
+                O(n) where n is the length of the string in bytes
+            Args:
+                string - string; input string to check
+            return:
+                bool"""
+        node = self._find_node(string.encode('utf-8'))
+        return node is not None and node.terminal
+
+    def insert(self, string):
+        """Insert the given string into this byte trie.
+            Time Complexity:
+                O(n) where n is the length of the string in bytes
+            Args:
+                string - string; input string to insert"""
+        node = self.root
+        for byte in string.encode('utf-8'):
+            above = node.bitmap >> byte
+            if above & 1:
+                node = node.children[-above.bit_count()]
+            else:
+                child = ByteTrieNode()
+                node.children.insert(len(node.children) - above.bit_count(),
+                                     child)
+                node.bitmap |= 1 << byte
+                node = child
+        if not node.is_terminal():
+            node.terminal = True
+            self.size += 1
+
+    def complete(self, prefix):
+        """Return a list of all strings stored in this byte trie that start
+        with the given prefix string, in lexicographic order."""
+        return list(self.iter_complete(prefix))
+
+    def iter_complete(self, prefix, sort=True):
+        """Generate all strings stored in this byte trie that start with the
+        given prefix string, one at a time, in lexicographic order.
+        Args:
+            prefix - string; given prefix of the words you want to generate
+            sort - bool; ignored, as children are kept in byte order, which
+                is code point order for UTF-8
+        Yield:
+            string; each word in the tree with the given prefix"""
+        key = prefix.encode('utf-8')
+        node = self._find_node(key)
+        if node is None:
+            return
+        stack = [(node, key)]
+        while stack:
+            node, key = stack.pop()
+            if node.is_terminal():
+                yield key.decode('utf-8')
+            for byte, child in reversed(node.items()):
+                stack.append((child, key + bytes((byte,))))
+
+    def strings(self):
+        """Return a list of all strings stored in this byte trie, in
+        lexicographic order."""
+        return list(self.iter_complete(''))
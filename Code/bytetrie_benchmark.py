@@ -0,0 +1,74 @@
+#!python3
+
+from autocomplete_benchmark import generate_queries, generate_vocabulary
+from bytetrie import ByteTrie
+from prefixtree import PrefixTree
+import argparse
+import time
+import tracemalloc
+
+
+def best_time(function, *args, repeat=3):
+    """Return the least seconds of the given number of calls of the given
+    function with the given arguments, which is the least disturbed by other
+    processes, and its result."""
+    best = None
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        result = function(*args)
+        elapsed = time.perf_counter() - start_time
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, result
+
+
+def contains_all(tree, queries):
+    """Return the number of the given queries stored in the given tree."""
+    return sum(tree.contains(query) for query in queries)
+
+
+def complete_all(tree, prefixes):
+    """Return the number of completions of the given prefixes in the tree."""
+    return sum(len(tree.complete(prefix)) for prefix in prefixes)
+
+
+def measure(tree_type, words, queries, prefixes):
+    """Return the seconds to build a tree of the given type with the given
+    words, the KiB of memory it allocates, the seconds to look up the given
+    queries and the seconds to complete the given prefixes."""
+    tracemalloc.start()
+    tree = tree_type(words)
+    memory = tracemalloc.get_traced_memory()[0] // 1024
+    tracemalloc.stop()
+    # Build again without tracing memory, which slows allocation down
+    del tree
+    build_time, tree = best_time(tree_type, words)
+    contains_time, _ = best_time(contains_all, tree, queries)
+    complete_time, _ = best_time(complete_all, tree, prefixes)
+    return build_time, memory, contains_time, complete_time
+
+
+def main():
+    """Read command-line arguments and compare building and searching a
+    ByteTrie and a PrefixTree of the same words."""
+    parser = argparse.ArgumentParser(
+        description='Compare ByteTrie with PrefixTree.')
+    parser.add_argument('--size', type=int, default=200000,
+                        help='number of words to store')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    words = generate_vocabulary(args.size, args.seed)
+    # Query stored words and, as misses, the same words with a suffix
+    queries = words + [word + 'q' for word in words]
+    prefixes = generate_queries(words, 'half', 10000, args.seed)
+    for name, tree_type in (('prefix', PrefixTree), ('bytes', ByteTrie)):
+        build_time, memory, contains_time, complete_time = measure(
+            tree_type, words, queries, prefixes)
+        print('{:>6}: build {:.3f} sec, {} KiB, contains {:.3f} sec, '
+              'complete {:.3f} sec'.format(name, build_time, memory,
+                                           contains_time, complete_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#!python3
+
+from bytetrie import ByteTrie, ByteTrieNode
+from prefixtree import make_prefix_tree
+import unittest
+
+
+class ByteTrieNodeTest(unittest.TestCase):
+
+    def test_child_methods(self):
+        node = ByteTrieNode()
+        assert node.num_children() == 0
+        assert node.get_child(ord('B')) is None
+        node_B = ByteTrieNode()
+        node_A = ByteTrieNode()
+        node_high = ByteTrieNode()
+        node.add_child(ord('B'), node_B)
+        node.add_child(0xFF, node_high)
+        node.add_child(ord('A'), node_A)
+        # Verify children are found through the bitmap in byte order
+        assert node.num_children() == 3
+        assert node.get_child(ord('A')) is node_A
+        assert node.get_child(ord('B')) is node_B
+        assert node.get_child(0xFF) is node_high
+        assert node.get_child(ord('C')) is None
+        assert node.items() == [(ord('A'), node_A), (ord('B'), node_B),
+                                (0xFF, node_high)]
+        with self.assertRaises(ValueError):
+            node.add_child(ord('A'), ByteTrieNode())
+
+
+class ByteTrieTest(unittest.TestCase):
+
+    def test_backend_selection(self):
+        tree = make_prefix_tree(['ABC'], backend='bytes')
+        assert isinstance(tree, ByteTrie)
+        assert tree.size == 1
+
+    def test_insert_branches_on_bytes(self):
+        tree = ByteTrie(['é', 'è'])
+        # Verify both characters share the node of their first UTF-8 byte
+        assert tree.root.num_children() == 1
+        assert tree.root.get_child(0xC3).num_children() == 2
+        assert tree.size == 2
+        tree.insert('é')
+        assert tree.size == 2
+
+    def test_contains(self):
+        tree = ByteTrie(['ABC', 'ABD', 'A', 'café'])
+        assert tree.contains('ABC') is True
+        assert tree.contains('A') is True
+        assert tree.contains('café') is True
+        assert tree.contains('AB') is False
+        assert tree.contains('cafe') is False
+        assert tree.contains('caf') is False
+
+    def test_complete(self):
+        strings = ['été', 'XYZ', 'ABD', 'A', 'ABC', '中文']
+        tree = ByteTrie(strings)
+        assert tree.complete('A') == ['A', 'ABC', 'ABD']
+        assert tree.complete('é') == ['été']
+        assert tree.complete('è') == []
+        assert tree.complete('中') == ['中文']
+        assert tree.strings() == sorted(strings)
+
+
+if __name__ == '__main__':
+    unittest.main()
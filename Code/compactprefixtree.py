@@ -0,0 +1,290 @@
+#!python3
+
+from array import array
+import mmap
+import struct
+import sys
+
+
+class CompactPrefixTree:
+    """CompactPrefixTree: A prefix tree with the same interface as PrefixTree
+    that stores its nodes in parallel typed arrays instead of node objects.
+    Node i is described by the code point of the character on its incoming
+    edge (labels[i]), the index of its first child (first_child[i]), the index
+    of its next sibling (next_sibling[i]), and bit i of the terminal bitmap.
+    Siblings are linked in sorted order of their characters, so traversals
+    retrieve strings in lexicographic order. Each node costs about 12 bytes,
+    a small fraction of a PrefixTreeNode with its own children dict."""
+
+    # Index of the root node in the parallel arrays
+    ROOT = 0
+    # Offset stored in first_child and next_sibling when there is no node
+    NO_NODE = -1
+
+    # Header of a saved image: magic bytes, number of nodes, number of strings
+    HEADER = struct.Struct('<4sII')
+    MAGIC = b'CPT1'
+
+    def __init__(self, strings=None):
+        """Initialize this prefix tree and insert the given strings, if any."""
+        # Code point of the character on the edge into each node
+        self.labels = array('I')
+        # Index of each node's first child and next sibling, or NO_NODE
+        self.first_child = array('i')
+        self.next_sibling = array('i')
+        # Bitmap with one bit per node that marks if it terminates a string
+        self.terminal = bytearray()
+        # Create the root node, which represents the empty string
+        self._new_node(0)
+        # Count the number of strings inserted into the tree
+        self.size = 0
+        # Memory map this tree's arrays view when loaded from a saved image
+        self.mmap = None
+        # Insert each string, if any were given
+        if strings is not None:
+            for string in strings:
+                self.insert(string)
+
+    def __repr__(self):
+        """Return a string representation of this prefix tree."""
+        return f'CompactPrefixTree({self.strings()!r})'
+
+    def __len__(self):
+        """Return the number of nodes stored in this prefix tree."""
+        return len(self.labels)
+
+    def is_empty(self):
+        """Return True if this prefix tree is empty (contains no strings)."""
+        return self.size == 0
+
+    def save(self, filename):
+        """Write this prefix tree to the given file as a flat binary image:
+        a header followed by the labels, first_child and next_sibling arrays
+        as little-endian 32-bit integers and then the terminal bitmap.
+        Args:
+            filename - string; path of the file to write"""
+        with open(filename, 'wb') as file:
+            file.write(CompactPrefixTree.HEADER.pack(
+                CompactPrefixTree.MAGIC, len(self), self.size))
+            for values in (self.labels, self.first_child, self.next_sibling):
+                values = array(values.typecode, values)
+                if sys.byteorder == 'big':
+                    values.byteswap()
+                file.write(values.tobytes())
+            file.write(bytes(self.terminal))
+
+    @classmethod
+    def load_mmap(cls, filename):
+        """Return a read-only prefix tree that answers queries directly from
+        a memory map of the image in the given file written by save, without
+        copying its arrays, so processes that load the same file share pages.
+        Args:
+            filename - string; path of the file to read
+        Return:
+            tree - CompactPrefixTree; read-only tree backed by the file"""
+        with open(filename, 'rb') as file:
+            image = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        header = CompactPrefixTree.HEADER
+        if len(image) < header.size:
+            image.close()
+            raise ValueError(f'File {filename!r} is not a prefix tree image')
+        magic, num_nodes, size = header.unpack_from(image)
+        if magic != CompactPrefixTree.MAGIC:
+            image.close()
+            raise ValueError(f'File {filename!r} is not a prefix tree image')
+        # Check the file holds the three arrays and the bitmap of every node,
+        # including the root, before creating views of them
+        if (num_nodes < 1 or len(image) <
+                header.size + 12 * num_nodes + (num_nodes + 7) // 8):
+            image.close()
+            raise ValueError(f'File {filename!r} is a truncated prefix tree '
+                             f'image')
+
+        tree = cls.__new__(cls)
+        tree.mmap = image
+        tree.size = size
+        view = memoryview(image)
+        offset = CompactPrefixTree.HEADER.size
+        arrays = []
+        for typecode in ('I', 'i', 'i'):
+            end = offset + 4 * num_nodes
+            if sys.byteorder == 'big':
+                # Views must be native so copy and swap the array instead
+                values = array(typecode, view[offset:end])
+                values.byteswap()
+            else:
+                values = view[offset:end].cast(typecode)
+            arrays.append(values)
+            offset = end
+        tree.labels, tree.first_child, tree.next_sibling = arrays
+        tree.terminal = view[offset:offset + (num_nodes + 7) // 8]
+        view.release()
+        return tree
+
+    def close(self):
+        """Release the memory map of a tree loaded from an image, after which
+        this tree can no longer be used."""
+        if self.mmap is not None:
+            for values in (self.labels, self.first_child, self.next_sibling,
+                           self.terminal):
+                if isinstance(values, memoryview):
+                    values.release()
+            self.mmap.close()
+
+    def is_terminal(self, node):
+        """Return True if the node at the given index terminates a string."""
+        return bool(self.terminal[node >> 3] & (1 << (node & 7)))
+
+    def _set_terminal(self, node):
+        """Mark the node at the given index as terminating a string."""
+        self.terminal[node >> 3] |= 1 << (node & 7)
+
+    def _new_node(self, code):
+        """Append a node with the given character code point and no children
+        to the parallel arrays and return its index."""
+        node = len(self.labels)
+        self.labels.append(code)
+        self.first_child.append(CompactPrefixTree.NO_NODE)
+        self.next_sibling.append(CompactPrefixTree.NO_NODE)
+        if node & 7 == 0:
+            # Grow the terminal bitmap by one byte for every eight nodes
+            self.terminal.append(0)
+        return node
+
+    def _get_child(self, node, code):
+        """Return the index of the child of the given node whose character has
+        the given code point, or NO_NODE if there is no such child.
+        Time Complexity:
+            O(k) where k is the number of children of the given node"""
+        labels = self.labels
+        child = self.first_child[node]
+        while child != CompactPrefixTree.NO_NODE:
+            label = labels[child]
+            if label == code:
+                return child
+            if label > code:
+                # Siblings are sorted so the character cannot appear later
+                break
+            child = self.next_sibling[child]
+        return CompactPrefixTree.NO_NODE
+
+    def contains(self, string):
+        """Return True if this prefix tree contains the given string.
+            Time Complexity:
+                O(n*k) where n is the length of the string and k is the
+                maximum number of children of a node along its path
+            Space Complexity:
+                O(1) No new nodes being created
+            Args:
+                string - string; input string to check
+            return:
+                bool"""
+        node, depth = self._find_node(string)
+        return depth == len(string) and self.is_terminal(node)
+
+    def insert(self, string):
+        """Insert the given string into this prefix tree.
+            Time Complexity:
+                O(n*k) where n is the length of the string and k is the
+                maximum number of children of a node along its path
+            Space Complexity:
+                O(n) where n is the number of characters in the string
+            Args:
+                string - string; input string to insert"""
+        if self.mmap is not None:
+            raise ValueError('Prefix tree loaded from an image is read-only')
+        labels = self.labels
+        first_child = self.first_child
+        next_sibling = self.next_sibling
+        node = CompactPrefixTree.ROOT
+
+        for char in string:
+            code = ord(char)
+            # Find the child with this character, or the sibling it follows
+            previous = CompactPrefixTree.NO_NODE
+            child = first_child[node]
+            while child != CompactPrefixTree.NO_NODE and labels[child] < code:
+                previous = child
+                child = next_sibling[child]
+
+            if child == CompactPrefixTree.NO_NODE or labels[child] != code:
+                # Link a new node between previous and child in sorted order
+                new_node = self._new_node(code)
+                next_sibling[new_node] = child
+                if previous == CompactPrefixTree.NO_NODE:
+                    first_child[node] = new_node
+                else:
+                    next_sibling[previous] = new_node
+                child = new_node
+
+            node = child
+
+        if not self.is_terminal(node):
+            self._set_terminal(node)
+            self.size += 1
+
+    def _find_node(self, string):
+        """Return a pair containing the index of the deepest node in this
+        prefix tree that matches the longest prefix of the given string and the
+        node's depth, which is equal to the number of prefix characters matched.
+        Args:
+            string - string; input string to check
+        Return:
+            tuple; deepest node index [0] and its depth [1]"""
+        node = CompactPrefixTree.ROOT
+        for depth, char in enumerate(string):
+            child = self._get_child(node, ord(char))
+            if child == CompactPrefixTree.NO_NODE:
+                return node, depth
+            node = child
+        return node, len(string)
+
+    def complete(self, prefix):
+        """Return a list of all strings stored in this prefix tree that start
+        with the given prefix string, in lexicographic order.
+        Args:
+            prefix - string; given prefix of the words you want to return
+        Return:
+            completions - list; a list of all the words in the tree with the given prefix"""
+        return list(self.iter_complete(prefix))
+
+    def iter_complete(self, prefix, sort=True):
+        """Generate all strings stored in this prefix tree that start with the
+        given prefix string, one at a time, in lexicographic order.
+        Args:
+            prefix - string; given prefix of the words you want to generate
+            sort - bool; ignored, as siblings are linked in sorted order
+        Yield:
+            string; each word in the tree with the given prefix"""
+        node, depth = self._find_node(prefix)
+        if depth == len(prefix):
+            yield from self._iter_traverse(node, prefix)
+
+    def strings(self):
+        """Return a list of all strings stored in this prefix tree, in
+        lexicographic order."""
+        return list(self._iter_traverse(CompactPrefixTree.ROOT, ''))
+
+    def _iter_traverse(self, node, prefix):
+        """Generate each string stored in the subtree of the node at the given
+        index in depth-first preorder.
+        Args:
+            node - int; index of the node to start traversing from
+            prefix - string; the string spelled by the path to the node
+        Yield:
+            string; each string that ends in the subtree"""
+        labels = self.labels
+        first_child = self.first_child
+        next_sibling = self.next_sibling
+        stack = [(node, prefix)]
+        while stack:
+            node, prefix = stack.pop()
+            if self.is_terminal(node):
+                yield prefix
+            children = []
+            child = first_child[node]
+            while child != CompactPrefixTree.NO_NODE:
+                children.append((child, prefix + chr(labels[child])))
+                child = next_sibling[child]
+            children.reverse()
+            stack.extend(children)
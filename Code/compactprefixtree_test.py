@@ -0,0 +1,115 @@
+#!python3
+
+from compactprefixtree import CompactPrefixTree
+from prefixtree import PrefixTree, make_prefix_tree
+import os
+import tempfile
+import unittest
+
+
+class CompactPrefixTreeTest(unittest.TestCase):
+
+    def test_init_and_properties(self):
+        tree = CompactPrefixTree()
+        # Verify tree size property
+        assert tree.size == 0
+        assert tree.is_empty() is True
+        # Verify only the root node is stored
+        assert len(tree) == 1
+        assert tree.is_terminal(CompactPrefixTree.ROOT) is False
+
+    def test_backend_selection(self):
+        tree = make_prefix_tree(['ABC', 'A'], backend='compact')
+        assert isinstance(tree, CompactPrefixTree)
+        assert tree.size == 2
+        assert isinstance(make_prefix_tree(backend='nodes'), PrefixTree)
+        with self.assertRaises(ValueError):
+            make_prefix_tree(backend='unknown')
+        with self.assertRaises(ValueError):
+            make_prefix_tree(backend='compact', cache_size=10)
+
+    def test_insert_shares_prefixes(self):
+        tree = CompactPrefixTree()
+        tree.insert('ABC')
+        assert len(tree) == 4
+        tree.insert('ABD')
+        assert len(tree) == 5
+        tree.insert('A')
+        assert len(tree) == 5
+        assert tree.size == 3
+        # Verify repeated insert does not change size
+        tree.insert('ABC')
+        assert tree.size == 3
+
+    def test_contains(self):
+        tree = CompactPrefixTree(['ABC', 'ABD', 'A', 'XYZ'])
+        assert tree.contains('ABC') is True
+        assert tree.contains('ABD') is True
+        assert tree.contains('A') is True
+        assert tree.contains('XYZ') is True
+        assert tree.contains('') is False
+        assert tree.contains('AB') is False
+        assert tree.contains('ABCD') is False
+        assert tree.contains('XY') is False
+        assert tree.contains('Z') is False
+
+    def test_complete(self):
+        tree = CompactPrefixTree(['XYZ', 'ABD', 'A', 'ABC'])
+        assert tree.complete('') == ['A', 'ABC', 'ABD', 'XYZ']
+        assert tree.complete('A') == ['A', 'ABC', 'ABD']
+        assert tree.complete('AB') == ['ABC', 'ABD']
+        assert tree.complete('ABD') == ['ABD']
+        assert tree.complete('AZ') == []
+        assert tree.complete('X') == ['XYZ']
+        assert tree.complete('Y') == []
+
+    def test_strings_match_prefix_tree(self):
+        strings = 'Shelly sells seashells by the sea shore'.split()
+        tree = CompactPrefixTree(strings)
+        assert tree.strings() == sorted(set(strings))
+        self.assertCountEqual(tree.strings(), PrefixTree(strings).strings())
+
+    def test_save_and_load_mmap(self):
+        strings = ['ABC', 'ABD', 'A', 'XYZ']
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'tree.bin')
+            PrefixTree(strings).save(filename)
+            tree = PrefixTree.load_mmap(filename)
+            # Verify queries are answered from the image
+            assert isinstance(tree, CompactPrefixTree)
+            assert tree.size == 4
+            assert len(tree) == 8
+            assert tree.contains('ABD') is True
+            assert tree.contains('AB') is False
+            assert tree.complete('AB') == ['ABC', 'ABD']
+            assert tree.strings() == sorted(strings)
+            # Verify the loaded tree is read-only
+            with self.assertRaises(ValueError):
+                tree.insert('B')
+            tree.close()
+
+    def test_load_mmap_with_invalid_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'tree.bin')
+            with open(filename, 'wb') as file:
+                file.write(b'not a prefix tree image')
+            with self.assertRaises(ValueError):
+                CompactPrefixTree.load_mmap(filename)
+            # Verify a file shorter than the header is rejected
+            with open(filename, 'wb') as file:
+                file.write(b'CPT1')
+            with self.assertRaises(ValueError):
+                CompactPrefixTree.load_mmap(filename)
+            # Verify a file shorter than its header says is rejected
+            PrefixTree(['ABC', 'ABD', 'XYZ']).save(filename)
+            with open(filename, 'rb') as file:
+                image = file.read()
+            for length in (len(image) - 1, CompactPrefixTree.HEADER.size + 4):
+                with open(filename, 'wb') as file:
+                    file.write(image[:length])
+                with self.assertRaises(ValueError):
+                    CompactPrefixTree.load_mmap(filename)
+
+
+if __name__ == '__main__':
+    unittest.main()
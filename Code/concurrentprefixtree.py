@@ -0,0 +1,129 @@
+#!python3
+
+from prefixtree import PrefixTree
+import threading
+
+
+class ConcurrentPrefixTree:
+    """ConcurrentPrefixTree: A prefix tree that can be read from many threads
+    while other threads add and delete strings. Readers query an immutable
+    snapshot, which is a PrefixTree that is never modified once published.
+    Writers take turns to copy the nodes along the path of the string they
+    change (path copying), modify the copies, and publish a new snapshot
+    whose root is the copied root, sharing every other node with the previous
+    snapshot. Publishing is a single reference assignment, so reads never
+    block and never observe a partially inserted or deleted string."""
+
+    def __init__(self, strings=None):
+        """Initialize this prefix tree and insert the given strings, if any."""
+        # Lock that lets one writer at a time create the next snapshot
+        self._write_lock = threading.Lock()
+        # Current snapshot that readers query
+        self._snapshot = PrefixTree(strings)
+
+    def __repr__(self):
+        """Return a string representation of this prefix tree."""
+        return f'ConcurrentPrefixTree({self.strings()!r})'
+
+    def snapshot(self):
+        """Return the current snapshot, a PrefixTree that reflects all writes
+        published so far and is never modified. Use it to answer several
+        queries consistently, but do not modify it."""
+        return self._snapshot
+
+    @property
+    def root(self):
+        """Return the root node of the current snapshot."""
+        return self._snapshot.root
+
+    @property
+    def size(self):
+        """Return the number of strings in the current snapshot."""
+        return self._snapshot.size
+
+    def is_empty(self):
+        """Return True if the current snapshot contains no strings."""
+        return self._snapshot.is_empty()
+
+    def contains(self, string):
+        """Return True if the current snapshot contains the given string."""
+        return self._snapshot.contains(string)
+
+    def complete(self, prefix):
+        """Return a list of all strings in the current snapshot that start
+        with the given prefix string."""
+        return self._snapshot.complete(prefix)
+
+    def iter_complete(self, prefix, sort=False):
+        """Generate all strings in the current snapshot that start with the
+        given prefix string. Later writes do not affect the strings generated."""
+        return self._snapshot.iter_complete(prefix, sort)
+
+    def complete_many(self, prefixes):
+        """Return a dict that maps each of the given prefix strings to a list
+        of all strings in the current snapshot that start with it."""
+        return self._snapshot.complete_many(prefixes)
+
+    def top_k(self, prefix, k, with_scores=False):
+        """Return a list of the k highest scoring strings in the current
+        snapshot that start with the given prefix string."""
+        return self._snapshot.top_k(prefix, k, with_scores)
+
+    def fuzzy_complete(self, prefix, max_edits):
+        """Return a list of all strings in the current snapshot that start
+        with a string within the given number of edits of the prefix."""
+        return self._snapshot.fuzzy_complete(prefix, max_edits)
+
+    def strings(self):
+        """Return a list of all strings in the current snapshot."""
+        return self._snapshot.strings()
+
+    def insert(self, string, score=None):
+        """Insert the given string with the given score and publish the new
+        snapshot. Blocks only while another writer is publishing.
+            Time Complexity:
+                O(n*k) where n is the length of the string and k is the
+                maximum number of children of a node along its path
+            Args:
+                string - string; input string to insert
+                score - number; score of the string used to rank completions,
+                    or None to keep the score of a stored string"""
+        with self._write_lock:
+            draft = self._draft(string)
+            draft.insert(string, score)
+            self._snapshot = draft
+
+    def delete(self, string):
+        """Delete the given string and publish the new snapshot, or raise
+        ValueError if it is not stored.
+            Time Complexity:
+                O(n*k) where n is the length of the string and k is the
+                maximum number of children of a node along its path
+            Args:
+                string - string; input string to delete"""
+        with self._write_lock:
+            draft = self._draft(string)
+            draft.delete(string)
+            self._snapshot = draft
+
+    def _draft(self, string):
+        """Return an unpublished PrefixTree that shares all nodes with the
+        current snapshot except copies of the nodes along the path of the given
+        string, which are the only nodes that inserting or deleting it changes.
+        Args:
+            string - string; string to be inserted or deleted
+        Return:
+            draft - PrefixTree; tree that can be modified along the path"""
+        snapshot = self._snapshot
+        draft = PrefixTree()
+        draft.root = snapshot.root.copy()
+        draft.size = snapshot.size
+        node = draft.root
+        for char in string:
+            child = node.find_child(char)
+            if child is None:
+                break
+            child = child.copy()
+            node.set_child(char, child)
+            node = child
+        return draft
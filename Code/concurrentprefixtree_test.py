@@ -0,0 +1,76 @@
+#!python3
+
+from concurrentprefixtree import ConcurrentPrefixTree
+import threading
+import unittest
+
+
+class ConcurrentPrefixTreeTest(unittest.TestCase):
+
+    def test_queries(self):
+        tree = ConcurrentPrefixTree(['ABC', 'ABD', 'A', 'XYZ'])
+        assert tree.size == 4
+        assert tree.is_empty() is False
+        assert tree.contains('ABD') is True
+        assert tree.contains('AB') is False
+        assert tree.complete('AB') == ['ABC', 'ABD']
+        assert tree.complete_many(['X', 'AB']) == \
+            {'X': ['XYZ'], 'AB': ['ABC', 'ABD']}
+        assert tree.fuzzy_complete('XZ', 1) == ['XYZ']
+        self.assertCountEqual(tree.strings(), ['ABC', 'ABD', 'A', 'XYZ'])
+
+    def test_snapshots_are_not_modified(self):
+        tree = ConcurrentPrefixTree(['ABC', 'XYZ'])
+        snapshot = tree.snapshot()
+        completions = tree.iter_complete('', sort=True)
+        tree.insert('ABD', 5)
+        tree.delete('XYZ')
+        # Verify earlier snapshots do not observe later writes
+        assert snapshot.size == 2
+        assert snapshot.strings() == ['ABC', 'XYZ']
+        assert list(completions) == ['ABC', 'XYZ']
+        # Verify the current snapshot reflects all writes
+        assert tree.size == 2
+        assert tree.complete('') == ['ABC', 'ABD']
+        assert tree.top_k('A', 1) == ['ABD']
+        with self.assertRaises(ValueError):
+            tree.delete('XYZ')
+
+    def test_snapshots_share_unchanged_nodes(self):
+        tree = ConcurrentPrefixTree(['ABC', 'XYZ'])
+        before = tree.root
+        tree.insert('ABD')
+        # Verify only nodes along the path of the new string were copied
+        assert tree.root is not before
+        assert tree.root.get_child('A') is not before.get_child('A')
+        assert tree.root.get_child('X') is before.get_child('X')
+        assert before.get_child('A').get_child('B').num_children() == 1
+
+    def test_concurrent_reads_and_writes(self):
+        words = [f'word{number:04}' for number in range(500)]
+        tree = ConcurrentPrefixTree()
+        errors = []
+
+        def read():
+            inserted = set(words)
+            while tree.size < len(words):
+                snapshot = tree.snapshot()
+                completions = snapshot.complete('word')
+                # Verify no partially inserted word is observed
+                if len(completions) != snapshot.size or \
+                        not inserted.issuperset(completions):
+                    errors.append(completions)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for word in words:
+            tree.insert(word)
+        for reader in readers:
+            reader.join()
+        assert errors == []
+        assert sorted(tree.strings()) == words
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+#!python3
+
+
+class DAWGNode:
+    """DAWGNode: A node for use in a directed acyclic word graph that stores a
+    structure of children nodes, which associates the next character in a
+    string to the next node along its path, and a boolean terminal property.
+    Unlike a PrefixTreeNode, a node may be the child of many parent nodes."""
+
+    __slots__ = ('id', 'children', 'terminal')
+
+    def __init__(self, id):
+        """Initialize this node with the given unique id number, an empty
+        structure of children nodes, and a boolean terminal property."""
+        # Unique number used to compare children nodes in signatures
+        self.id = id
+        # Dict to associate character keys to children node values
+        self.children = {}
+        # Marks if this node terminates a string in the word graph
+        self.terminal = False
+
+    def is_terminal(self):
+        """Return True if this node terminates a string."""
+        return self.terminal
+
+    def signature(self):
+        """Return a hashable key that is equal for nodes whose subgraphs store
+        the same set of string suffixes, once their children are minimized."""
+        return (self.terminal,
+                tuple((char, child.id) for char, child in self.children.items()))
+
+    def __repr__(self):
+        """Return a code representation of this node."""
+        return f'DAWGNode({self.id!r})'
+
+
+class DAWG:
+    """DAWG: A directed acyclic word graph, which is a prefix tree whose nodes
+    with identical subtrees are merged, so strings share common suffixes as
+    well as common prefixes (for example, '-ing' and '-tion' are stored once).
+    The graph is built incrementally from strings in sorted order, minimizing
+    each branch as soon as no later string can extend it, and is read-only
+    afterward. It supports the same queries as PrefixTree."""
+
+    def __init__(self, strings=None):
+        """Initialize this word graph with the given strings, if any, which
+        must be in sorted order, or raise ValueError if they are not."""
+        # Create a new root node, which represents the empty string
+        self._next_id = 0
+        self.root = self._new_node()
+        # Count the number of strings stored in the word graph
+        self.size = 0
+        # Edges (parent, character, child) along the previous string's path
+        # whose child nodes have not been merged with equivalent nodes yet
+        unchecked = []
+        # Map signatures to the minimized nodes they represent
+        minimized = {}
+        previous = None
+
+        for string in strings if strings is not None else ():
+            common = 0
+            if previous is not None:
+                if string <= previous:
+                    if string == previous:
+                        continue
+                    raise ValueError(f'String {string!r} is out of sorted '
+                                     f'order after {previous!r}')
+                limit = min(len(previous), len(string))
+                while common < limit and previous[common] == string[common]:
+                    common += 1
+            # The previous string's path below the common prefix is final
+            self._minimize(unchecked, minimized, common)
+
+            node = unchecked[-1][2] if unchecked else self.root
+            for char in string[common:]:
+                child = self._new_node()
+                node.children[char] = child
+                unchecked.append((node, char, child))
+                node = child
+            node.terminal = True
+            self.size += 1
+            previous = string
+
+        self._minimize(unchecked, minimized, 0)
+
+    def _new_node(self):
+        """Return a new node with the next unique id number."""
+        node = DAWGNode(self._next_id)
+        self._next_id += 1
+        return node
+
+    def _minimize(self, unchecked, minimized, depth):
+        """Merge each unchecked node deeper than the given depth with an
+        equivalent minimized node, if any, from the deepest node upward.
+        Args:
+            unchecked - list; edges along the previous string's path
+            minimized - dict; signatures of the minimized nodes
+            depth - int; number of unchecked edges to keep"""
+        while len(unchecked) > depth:
+            parent, char, child = unchecked.pop()
+            signature = child.signature()
+            equivalent = minimized.get(signature)
+            if equivalent is None:
+                minimized[signature] = child
+            else:
+                parent.children[char] = equivalent
+
+    def __repr__(self):
+        """Return a string representation of this word graph."""
+        return f'DAWG({self.strings()!r})'
+
+    def __len__(self):
+        """Return the number of distinct nodes in this word graph."""
+        seen = {self.root.id}
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            for child in node.children.values():
+                if child.id not in seen:
+                    seen.add(child.id)
+                    stack.append(child)
+        return len(seen)
+
+    def is_empty(self):
+        """Return True if this word graph is empty (contains no strings)."""
+        return self.size == 0
+
+    def _find_node(self, string):
+        """Return the node at the end of the path that spells the given string,
+        or None if no string in this word graph starts with it."""
+        node = self.root
+        for char in string:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def contains(self, string):
+        """Return True if this word graph contains the given string.
+            Time Complexity:
+                O(n) where n is the length of the string that is given
+            Args:
+                string - string; input string to check
+            return:
+                bool"""
+        node = self._find_node(string)
+        return node is not None and node.is_terminal()
+
+    def complete(self, prefix):
+        """Return a list of all strings stored in this word graph that start
+        with the given prefix string, in lexicographic order.
+        Args:
+            prefix - string; given prefix of the words you want to return
+        Return:
+            completions - list; a list of all the words with the given prefix"""
+        return list(self.iter_complete(prefix))
+
+    def iter_complete(self, prefix, sort=True):
+        """Generate all strings stored in this word graph that start with the
+        given prefix string, one at a time, in lexicographic order.
+        Args:
+            prefix - string; given prefix of the words you want to generate
+            sort - bool; ignored, as children are added in sorted order
+        Yield:
+            string; each word with the given prefix"""
+        node = self._find_node(prefix)
+        if node is None:
+            return
+        stack = [(node, prefix)]
+        while stack:
+            node, prefix = stack.pop()
+            if node.is_terminal():
+                yield prefix
+            for char, child in reversed(node.children.items()):
+                stack.append((child, prefix + char))
+
+    def strings(self):
+        """Return a list of all strings stored in this word graph, in
+        lexicographic order."""
+        return list(self.iter_complete(''))
@@ -0,0 +1,66 @@
+#!python3
+
+from dawg import DAWG
+from prefixtree import PrefixTree
+import unittest
+
+
+class DAWGTest(unittest.TestCase):
+
+    def test_init_and_properties(self):
+        graph = DAWG()
+        assert graph.size == 0
+        assert graph.is_empty() is True
+        assert graph.root.is_terminal() is False
+        assert len(graph) == 1
+
+    def test_init_with_unsorted_strings(self):
+        with self.assertRaises(ValueError):
+            DAWG(['ABC', 'AB'])
+
+    def test_suffixes_are_shared(self):
+        graph = DAWG(['tap', 'taps', 'top', 'tops'])
+        assert graph.size == 4
+        # Verify nodes 'a' and 'o' were merged since their suffixes match
+        node_t = graph.root.children['t']
+        assert node_t.children['a'] is node_t.children['o']
+        # Nodes are root, 't', 'a' or 'o', 'p' and 's'
+        assert len(graph) == 5
+
+    def test_suffixes_are_shared_across_branches(self):
+        strings = ['acting', 'bring', 'eating', 'ring', 'sing']
+        graph = DAWG(strings)
+        # Verify every string shares the nodes of its suffix 'ing'
+        node_ing = graph.root.children['r'].children['i']
+        assert graph.root.children['s'].children['i'] is node_ing
+        node_b = graph.root.children['b']
+        assert node_b.children['r'] is graph.root.children['r']
+        assert len(graph) < sum(len(string) for string in strings)
+
+    def test_duplicate_strings(self):
+        graph = DAWG(['A', 'A', 'AB', 'AB'])
+        assert graph.size == 2
+        assert graph.strings() == ['A', 'AB']
+
+    def test_contains(self):
+        graph = DAWG(['A', 'ABC', 'ABD', 'XYZ'])
+        assert graph.contains('A') is True
+        assert graph.contains('ABC') is True
+        assert graph.contains('ABD') is True
+        assert graph.contains('XYZ') is True
+        assert graph.contains('') is False
+        assert graph.contains('AB') is False
+        assert graph.contains('ABCD') is False
+        assert graph.contains('XYC') is False
+
+    def test_complete(self):
+        strings = sorted('Shelly sells seashells by the sea shore'.split())
+        graph = DAWG(strings)
+        tree = PrefixTree(strings)
+        for prefix in ['', 'S', 's', 'se', 'sea', 'sh', 'x', 'shells']:
+            assert graph.complete(prefix) == sorted(tree.complete(prefix))
+        assert graph.strings() == strings
+
+
+if __name__ == '__main__':
+    unittest.main()
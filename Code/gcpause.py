@@ -0,0 +1,20 @@
+#!python3
+
+from contextlib import contextmanager
+import gc
+
+
+@contextmanager
+def paused_gc():
+    """Pause the cyclic garbage collector while building a tree, which
+    otherwise rescans the growing tree over and over although its nodes form
+    no cycles, and restore it afterward if it was enabled. The collector is
+    paused for the whole process, so cycles that other threads create in the
+    meantime are not collected until it is restored."""
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if gc_was_enabled:
+            gc.enable()
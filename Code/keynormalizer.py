@@ -0,0 +1,114 @@
+#!python3
+
+import unicodedata
+
+
+class KeyNormalizer:
+    """KeyNormalizer: A callable that maps strings to normalized keys, so that
+    variants a user would consider the same word are stored and searched as
+    one key. It can apply a Unicode normalization form (NFKC by default, which
+    also maps compatibility characters such as ligatures to their plain form),
+    strip accents and other combining marks, and fold case."""
+
+    def __init__(self, casefold=True, form='NFKC', strip_accents=False):
+        """Initialize this normalizer with the given options: casefold to fold
+        case, form for the Unicode normalization form ('NFC', 'NFKC', 'NFD',
+        'NFKD' or None for none), and strip_accents to remove combining marks."""
+        if form not in ('NFC', 'NFKC', 'NFD', 'NFKD', None):
+            raise ValueError(f'Unknown normalization form {form!r}')
+        self.casefold = casefold
+        self.form = form
+        self.strip_accents = strip_accents
+
+    def __repr__(self):
+        """Return a code representation of this normalizer."""
+        return (f'KeyNormalizer(casefold={self.casefold!r}, '
+                f'form={self.form!r}, strip_accents={self.strip_accents!r})')
+
+    def __call__(self, string):
+        """Return the normalized key of the given string."""
+        if self.strip_accents:
+            # Decompose characters so accents become separate combining marks,
+            # including those of compatibility characters for the NFK forms
+            decomposed = 'NFKD' if self.form in ('NFKC', 'NFKD') else 'NFD'
+            string = ''.join(char for char in unicodedata.normalize(decomposed,
+                                                                    string)
+                             if not unicodedata.combining(char))
+        if self.casefold:
+            string = string.casefold()
+        if self.form is not None:
+            string = unicodedata.normalize(self.form, string)
+        return string
+
+
+class NormalizedPrefixTree:
+    """NormalizedPrefixTree: A prefix tree that normalizes every string and
+    prefix with a KeyNormalizer before passing it to another prefix tree,
+    such as a PrefixTree or ByteTrie. Completions are returned as normalized
+    keys. Other attributes and methods are those of the wrapped tree. Methods
+    the wrapped tree does not have, such as top_k on a ByteTrie, raise
+    ValueError."""
+
+    def __init__(self, tree, normalizer, strings=None):
+        """Initialize this prefix tree to wrap the given tree with the given
+        normalizer, and insert the given strings, if any."""
+        self.tree = tree
+        self.normalizer = normalizer
+        if strings is not None:
+            for string in strings:
+                self.insert(string)
+
+    def __repr__(self):
+        """Return a string representation of this prefix tree."""
+        return f'NormalizedPrefixTree({self.tree!r}, {self.normalizer!r})'
+
+    def __getattr__(self, name):
+        """Return the given attribute of the wrapped tree."""
+        return getattr(self.tree, name)
+
+    def _method(self, name):
+        """Return the given method of the wrapped tree, or raise ValueError if
+        the wrapped tree does not support it."""
+        method = getattr(self.tree, name, None)
+        if method is None:
+            raise ValueError(f'{type(self.tree).__name__} does not support '
+                             f'{name}')
+        return method
+
+    def insert(self, string, *args):
+        """Insert the normalized key of the given string."""
+        self.tree.insert(self.normalizer(string), *args)
+
+    def delete(self, string):
+        """Delete the normalized key of the given string."""
+        self._method('delete')(self.normalizer(string))
+
+    def contains(self, string):
+        """Return True if the normalized key of the given string is stored."""
+        return self.tree.contains(self.normalizer(string))
+
+    def complete(self, prefix):
+        """Return a list of all keys that start with the normalized prefix."""
+        return self.tree.complete(self.normalizer(prefix))
+
+    def iter_complete(self, prefix, sort=False):
+        """Generate all keys that start with the normalized prefix."""
+        return self.tree.iter_complete(self.normalizer(prefix), sort)
+
+    def complete_many(self, prefixes):
+        """Return a dict that maps each of the given prefixes to a list of all
+        keys that start with its normalized key."""
+        keys = {prefix: self.normalizer(prefix) for prefix in prefixes}
+        results = self._method('complete_many')(set(keys.values()))
+        return {prefix: results[key] for prefix, key in keys.items()}
+
+    def top_k(self, prefix, k, with_scores=False):
+        """Return the k highest scoring keys that start with the normalized
+        prefix."""
+        return self._method('top_k')(self.normalizer(prefix), k, with_scores)
+
+    def fuzzy_complete(self, prefix, max_edits):
+        """Return all keys that start with a string within the given number of
+        edits of the normalized prefix."""
+        return self._method('fuzzy_complete')(self.normalizer(prefix),
+                                              max_edits)
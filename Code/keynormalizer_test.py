@@ -0,0 +1,74 @@
+#!python3
+
+from keynormalizer import KeyNormalizer, NormalizedPrefixTree
+from prefixtree import PrefixTree, make_prefix_tree
+from bytetrie import ByteTrie
+import unittest
+
+
+class KeyNormalizerTest(unittest.TestCase):
+
+    def test_normalize(self):
+        normalize = KeyNormalizer()
+        # Verify case is folded and compatibility characters are replaced
+        assert normalize('Apple') == 'apple'
+        assert normalize('STRASSE') == normalize('straße')
+        assert normalize('ﬁle') == 'file'
+        # Verify composed and decomposed accents produce the same key
+        assert normalize('café') == normalize('café') == 'café'
+
+    def test_strip_accents(self):
+        normalize = KeyNormalizer(strip_accents=True)
+        assert normalize('Café') == 'cafe'
+        assert normalize('café') == 'cafe'
+        assert normalize('Crème Brûlée') == 'creme brulee'
+        # Verify accents of compatibility characters are stripped too
+        assert normalize('\u01c4') == 'dz'
+        assert normalize('\uff76\uff9e') == normalize('\u30ac') == '\u30ab'
+        # Verify only canonical decomposition is used without an NFK form
+        assert KeyNormalizer(form='NFC', strip_accents=True)('x²é') == 'x²e'
+
+    def test_options(self):
+        normalize = KeyNormalizer(casefold=False, form=None)
+        assert normalize('Café') == 'Café'
+        with self.assertRaises(ValueError):
+            KeyNormalizer(form='NFX')
+
+
+class NormalizedPrefixTreeTest(unittest.TestCase):
+
+    strings = ['Apple', 'apple', 'APPLET', 'Café', 'cafés']
+
+    def test_prefix_tree(self):
+        tree = make_prefix_tree(self.strings, normalizer=KeyNormalizer())
+        assert isinstance(tree, NormalizedPrefixTree)
+        assert isinstance(tree.tree, PrefixTree)
+        # Verify variants are stored as one key
+        assert tree.size == 4
+        assert tree.contains('APPLE') is True
+        assert tree.complete('aPP') == ['apple', 'applet']
+        assert tree.complete('CAFÉ') == ['café', 'cafés']
+        assert tree.complete_many(['APP', 'app']) == \
+            {'APP': ['apple', 'applet'], 'app': ['apple', 'applet']}
+        tree.delete('ApPlEt')
+        assert tree.contains('applet') is False
+
+    def test_byte_trie_with_accents_stripped(self):
+        tree = make_prefix_tree(self.strings, backend='bytes',
+                                normalizer=KeyNormalizer(strip_accents=True))
+        assert isinstance(tree.tree, ByteTrie)
+        assert tree.complete('Café') == ['cafe', 'cafes']
+        assert tree.strings() == ['apple', 'applet', 'cafe', 'cafes']
+        # Verify methods a byte trie does not have are rejected clearly
+        with self.assertRaises(ValueError):
+            tree.top_k('app', 2)
+        with self.assertRaises(ValueError):
+            tree.complete_many(['app'])
+        with self.assertRaises(ValueError):
+            tree.delete('apple')
+        with self.assertRaises(ValueError):
+            tree.fuzzy_complete('app', 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,14 @@
 #!python3
 
 from prefixtreenode import PrefixTreeNode
-from collections import deque
+from compactprefixtree import CompactPrefixTree
+from radixtree import RadixTree
+from bytetrie import ByteTrie
+from keynormalizer import NormalizedPrefixTree
+from binaryheap import BinaryMinHeap
+from gcpause import paused_gc
+from bisect import bisect_left
+from collections import deque, OrderedDict
 
 
 class PrefixTree:
@@ -19,17 +26,86 @@ class PrefixTree:
     # Constant for the start character stored in the prefix tree's root node
     START_CHARACTER = ''
 
-    def __init__(self, strings=None):
-        """Initialize this prefix tree and insert the given strings, if any."""
+    def __init__(self, strings=None, cache_size=None):
+        """Initialize this prefix tree and insert the given strings, if any.
+        If cache_size is given, cache the results of complete for recently
+        used prefixes, holding at most cache_size completions in total.
+        To store the strings with another backend, see make_prefix_tree."""
         # Create a new root node with the start character
         self.root = PrefixTreeNode(PrefixTree.START_CHARACTER)
         # Count the number of strings inserted into the tree
         self.size = 0
+        # Map recently completed prefixes to their completions, least recent
+        # first, if caching is enabled, and count cache lookups
+        self.cache = OrderedDict() if cache_size is not None else None
+        self.cache_size = cache_size
+        self.cached_completions = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
         # Insert each string, if any were given
         if strings is not None:
             for string in strings:
                 self.insert(string)
 
+    @classmethod
+    def from_sorted(cls, strings, cache_size=None):
+        """Return a new prefix tree built from the given iterable of strings in
+        sorted order in a single streaming pass. Each string shares the path of
+        its common prefix with the previous string, and the remaining nodes are
+        always new, so no children are searched for or checked while building.
+        The garbage collector is paused while building (see paused_gc), so
+        avoid it while other threads allocate many objects. Raise ValueError
+        if the strings are not in sorted order.
+        Time Complexity:
+            O(n) where n is the total number of characters in the strings
+        Space Complexity:
+            O(h) where h is the length of the longest string, for the path of
+            the previous string (besides the nodes of the tree)
+        Args:
+            strings - iterable; strings in sorted order, duplicates allowed
+            cache_size - int; completion cache size, or None for no cache
+        Return:
+            tree - PrefixTree; a prefix tree containing the given strings"""
+        tree = cls(cache_size=cache_size)
+        with paused_gc():
+            # Path of nodes from the root to the previous string's end node
+            path = [tree.root]
+            previous = None
+
+            for string in strings:
+                common = 0
+                if previous is not None:
+                    if string <= previous:
+                        if string == previous:
+                            continue
+                        raise ValueError(f'String {string!r} is out of sorted '
+                                         f'order after {previous!r}')
+                    # Keep the nodes of the prefix shared with previous string
+                    limit = min(len(previous), len(string))
+                    while (common < limit and
+                           previous[common] == string[common]):
+                        common += 1
+                    del path[common + 1:]
+
+                node = path[-1]
+                for char in string[common:]:
+                    child = PrefixTreeNode(char)
+                    child.best = 0
+                    node.set_child(char, child)
+                    path.append(child)
+                    node = child
+
+                node.terminal = True
+                node.best = 0
+                for node in path:
+                    node.count += 1
+                tree.size += 1
+                previous = string
+
+        if tree.size > 0:
+            tree.root.best = 0
+        return tree
+
     def __repr__(self):
         """Return a string representation of this prefix tree."""
         return f'PrefixTree({self.strings()!r})'
@@ -38,6 +114,25 @@ class PrefixTree:
         """Return True if this prefix tree is empty (contains no strings)."""
         return True if self.size == 0 else False
 
+    def save(self, filename):
+        """Write the strings in this prefix tree to the given file as a flat
+        binary image that load_mmap can query without deserializing it.
+        Scores are not saved. See CompactPrefixTree.save for the layout.
+        Args:
+            filename - string; path of the file to write"""
+        compact = CompactPrefixTree(self.iter_complete('', sort=True))
+        compact.save(filename)
+
+    @staticmethod
+    def load_mmap(filename):
+        """Return a read-only prefix tree that answers queries directly from
+        a memory map of the image in the given file written by save.
+        Args:
+            filename - string; path of the file to read
+        Return:
+            tree - CompactPrefixTree; read-only tree backed by the file"""
+        return CompactPrefixTree.load_mmap(filename)
+
     def contains(self, string):
         """Return True if this prefix tree contains the given string.
             Time Complexity:
@@ -48,38 +143,99 @@ class PrefixTree:
                 string - string; input string to check
             return:
                 bool"""
-        node = self.root
-        
-        for char in string:
-            try:
-                node = node.get_child(char)
-            except ValueError:
-                return node.is_terminal()
-        
-        return node.is_terminal()
-
-    def insert(self, string):
-        """Insert the given string into this prefix tree.
+        node, depth = self._find_node(string)
+        return depth == len(string) and node.is_terminal()
+
+    def insert(self, string, score=None):
+        """Insert the given string into this prefix tree with the given score,
+        such as its frequency, which ranks it among completions in top_k.
+        Inserting a string that is already stored replaces its score, or keeps
+        it if no score is given. A new string without a score scores 0.
             Time Complexity:
                 O(n) where n is the length of the string that is given
             Space Complexity:
                 O(n) where n is the number of characters in the string
             Args:
-                string - string; input string to insert"""
+                string - string; input string to insert
+                score - number; score of the string used to rank completions,
+                    or None to keep the score of a stored string"""
         node = self.root
+        path = [node]
 
         for char in string:
-            try: 
-                node = node.get_child(char)
-            except ValueError:
-                new_node = PrefixTreeNode(char)
-                node.add_child(char, new_node)
-
-                node = new_node
+            child = node.find_child(char)
+            if child is None:
+                child = PrefixTreeNode(char)
+                node.set_child(char, child)
+            node = child
+            path.append(node)
 
         if not node.is_terminal():
             node.terminal = True
             self.size += 1
+            for path_node in path:
+                path_node.count += 1
+            self._invalidate(string)
+            if score is None:
+                score = 0
+        elif score is None:
+            return
+        elif score < node.score:
+            # Lowering a score may lower the best scores cached along the path
+            node.score = score
+            self._update_best(path)
+            return
+        node.score = score
+        # Raise the best score cached in every node along the path
+        for node in path:
+            if node.best < score:
+                node.best = score
+
+    def delete(self, string):
+        """Delete the given string from this prefix tree, or raise ValueError
+        if it is not stored. Nodes left without any string that terminates in
+        their subtree are pruned, so memory stays proportional to the strings
+        still stored.
+            Time Complexity:
+                O(n*k) where n is the length of the string and k is the
+                maximum number of children of a node along its path
+            Space Complexity:
+                O(n) where n is the number of characters in the string
+            Args:
+                string - string; input string to delete"""
+        node, depth = self._find_node(string)
+        if depth < len(string) or not node.is_terminal():
+            raise ValueError(f'String {string!r} is not in prefix tree')
+
+        path = [self.root]
+        for char in string:
+            path.append(path[-1].find_child(char))
+        node.terminal = False
+        node.score = 0
+        for path_node in path:
+            path_node.count -= 1
+
+        # Prune the highest node whose subtree holds no strings anymore
+        for depth in range(1, len(path)):
+            if path[depth].count == 0:
+                path[depth - 1].remove_child(string[depth - 1])
+                del path[depth:]
+                break
+        self._update_best(path)
+        self.size -= 1
+        self._invalidate(string)
+
+    def _update_best(self, path):
+        """Recompute the best score cached in each node along the given path
+        of nodes from the root, starting from the deepest node.
+        Args:
+            path - list; nodes from the root to the deepest node to update"""
+        for node in reversed(path):
+            best = node.score if node.is_terminal() else float('-inf')
+            for child in node.child_nodes():
+                if best < child.best:
+                    best = child.best
+            node.best = best
 
     def _find_node(self, string):
         """Return a pair containing the deepest node in this prefix tree that
@@ -100,12 +256,12 @@ class PrefixTree:
         # Start with the root node
         node = self.root
         i = 0
-        while i < len(string) and node.has_child(string[i]) is True:
-            try:
-                node = node.get_child(string[i])
-                i += 1
-            except ValueError:
-                return node, i
+        for char in string:
+            child = node.find_child(char)
+            if child is None:
+                break
+            node = child
+            i += 1
 
         return node, i
 
@@ -120,17 +276,202 @@ class PrefixTree:
             prefix - string; given prefix of the words you want to return
         Return:
             completions - list; a list of all the words in the tree with the given prefix"""
-        # Create a list of completions in prefix tree
-        if prefix == "":
-            return self.strings()
-
+        if self.cache is None:
+            return list(self.iter_complete(prefix))
+
+        completions = self.cache.get(prefix)
+        if completions is not None:
+            self.cache_hits += 1
+            self.cache.move_to_end(prefix)
+            return list(completions)
+
+        self.cache_misses += 1
+        completions = tuple(self.iter_complete(prefix))
+        # Count each entry as at least one so empty results are bounded too
+        weight = len(completions) or 1
+        if weight <= self.cache_size:
+            self.cache[prefix] = completions
+            self.cached_completions += weight
+            # Evict least recently used prefixes until the cache fits
+            while self.cached_completions > self.cache_size:
+                _, evicted = self.cache.popitem(last=False)
+                self.cached_completions -= len(evicted) or 1
+        return list(completions)
+
+    def _invalidate(self, string):
+        """Remove the cached completions of every prefix of the given string,
+        which are the only cached results that change when it is added or
+        deleted.
+        Args:
+            string - string; string added to or deleted from this tree"""
+        if not self.cache:
+            return
+        for length in range(len(string) + 1):
+            completions = self.cache.pop(string[:length], None)
+            if completions is not None:
+                self.cached_completions -= len(completions) or 1
+
+    def clear_cache(self):
+        """Remove all cached completions and reset the cache counters."""
+        if self.cache is not None:
+            self.cache.clear()
+        self.cached_completions = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def iter_complete(self, prefix, sort=False):
+        """Generate all strings stored in this prefix tree that start with the
+        given prefix string, one at a time, so callers can stop early without
+        paying for the rest of the prefix's subtree.
+        Time Complexity:
+            O(n) where n is the number of letters in each word generated
+        Space Complexity:
+            O(h*k) where h is the height of the subtree and k is the maximum
+            number of children of a node, for the stack of nodes to visit
+        Args:
+            prefix - string; given prefix of the words you want to generate
+            sort - bool; generate the words in lexicographic order if True
+        Yield:
+            string; each word in the tree with the given prefix"""
+        node, depth = self._find_node(prefix)
+        if depth == len(prefix):
+            yield from self._iter_traverse(node, prefix, sort)
+
+    def complete_many(self, prefixes):
+        """Return a dict that maps each of the given prefix strings to a list
+        of all strings stored in this prefix tree that start with it, in
+        lexicographic order. Prefixes are answered in sorted order so that
+        each descent from the root reuses the nodes of the prefix it shares
+        with the previous one, and a prefix that extends an earlier prefix is
+        answered with a slice of the earlier prefix's completions instead of
+        traversing the same subtree again.
+        Time Complexity:
+            O(p*log(p) + m + n) where p is the number of prefixes, m is the
+            number of characters descended, and n is the number of letters in
+            each word completed for a prefix not nested in another prefix
+        Args:
+            prefixes - iterable; given prefixes of the words you want to return
+        Return:
+            results - dict; maps each prefix to its list of completions"""
+        results = {}
+        # Path of nodes from the root spelling the last prefix descended
+        path = [self.root]
+        descended = ''
+        # Last prefix traversed and its sorted completions
+        outer_prefix = None
+        outer_completions = None
+
+        for prefix in sorted(set(prefixes)):
+            if outer_prefix is not None and prefix.startswith(outer_prefix):
+                # Completions of a nested prefix are a contiguous slice
+                low = bisect_left(outer_completions, prefix)
+                high = low
+                while (high < len(outer_completions) and
+                       outer_completions[high].startswith(prefix)):
+                    high += 1
+                results[prefix] = outer_completions[low:high]
+                continue
+
+            # Reuse the nodes of the prefix shared with the last descent
+            common = 0
+            limit = min(len(descended), len(prefix))
+            while common < limit and descended[common] == prefix[common]:
+                common += 1
+            del path[common + 1:]
+            node = path[-1]
+            for char in prefix[common:]:
+                node = node.find_child(char)
+                if node is None:
+                    break
+                path.append(node)
+            descended = prefix[:len(path) - 1]
+
+            if len(descended) == len(prefix):
+                completions = list(self._iter_traverse(path[-1], prefix, True))
+            else:
+                completions = []
+            results[prefix] = completions
+            outer_prefix, outer_completions = prefix, completions
+        return results
+
+    def top_k(self, prefix, k, with_scores=False):
+        """Return a list of the k highest scoring strings stored in this prefix
+        tree that start with the given prefix string, ordered by decreasing
+        score and then lexicographically. Nodes are expanded best-first using
+        the best score cached in each node, so only the branches that can hold
+        one of the top k strings are visited.
+        Time Complexity:
+            O(k*h*c*log(k*h*c)) where h is the height of the subtree and c is
+            the maximum number of children of a node, independent of the
+            number of strings that start with the prefix
+        Space Complexity:
+            O(k*h*c) for the heap of nodes and strings to visit
+        Args:
+            prefix - string; given prefix of the words you want to return
+            k - int; maximum number of words to return
+            with_scores - bool; return (word, score) pairs if True
+        Return:
+            completions - list; the top k words in the tree with the given prefix"""
         completions = []
+        node, depth = self._find_node(prefix)
+        if k <= 0 or depth < len(prefix) or node.best == float('-inf'):
+            return completions
+
+        # Entries are (negated score, string, kind, node) so the min heap
+        # yields the best string first; kind orders a terminal string before
+        # the node with the same path and keeps nodes from being compared
+        heap = BinaryMinHeap([(-node.best, prefix, 1, node)])
+        while not heap.is_empty() and len(completions) < k:
+            negated_score, string, kind, node = heap.delete_min()
+            if kind == 0:
+                completions.append((string, -negated_score) if with_scores
+                                   else string)
+                continue
+            if node.is_terminal():
+                heap.insert((-node.score, string, 0, None))
+            for char, child in node.child_items():
+                if child.best != float('-inf'):
+                    heap.insert((-child.best, string + char, 1, child))
+        return completions
 
-        node,  _ = self._find_node(prefix)
-        
-        if node.character != "":
-            self._traverse(node, prefix, completions.append)
-
+    def fuzzy_complete(self, prefix, max_edits):
+        """Return a list of all strings stored in this prefix tree that start
+        with a string within the given number of edits (insertions, deletions
+        or substitutions of one character) of the given prefix string.
+        The tree is walked depth-first keeping the row of the Levenshtein
+        distance table between the prefix and the path to each node, and a
+        branch is pruned when every distance in its row exceeds the budget.
+        Time Complexity:
+            O(m*v + n) where m is the length of the prefix, v is the number of
+            nodes visited within the budget, and n is the number of letters in
+            each word returned
+        Space Complexity:
+            O(m*h*k) for the stack of rows, where h is the height of the tree
+            and k is the maximum number of children of a node
+        Args:
+            prefix - string; given prefix of the words you want to return
+            max_edits - int; maximum edit distance from the given prefix
+        Return:
+            completions - list; a list of all the words in the tree that start
+            with a string within max_edits of the given prefix"""
+        completions = []
+        # Distances from the empty path to each prefix of the given prefix
+        stack = [(self.root, '', list(range(len(prefix) + 1)))]
+        while stack:
+            node, path, row = stack.pop()
+            if row[-1] <= max_edits:
+                # The path matches the prefix, so every completion matches
+                completions.extend(self._iter_traverse(node, path, False))
+                continue
+            if min(row) > max_edits:
+                continue  # No extension of the path can match the prefix
+            for char, child in reversed(node.child_items()):
+                next_row = [row[0] + 1]
+                for index, prefix_char in enumerate(prefix, 1):
+                    next_row.append(min(next_row[index - 1] + 1,
+                                        row[index] + 1,
+                                        row[index - 1] + (prefix_char != char)))
+                stack.append((child, path + char, next_row))
         return completions
 
     def strings(self):
@@ -142,29 +483,64 @@ class PrefixTree:
         Return:
             all_strings - dynamic array; a list of all the strings in the tree"""
         # Create a list of all strings in prefix tree
-        all_strings = []
-        self._traverse(self.root, "", all_strings.append)
-        return all_strings
-
-    def _traverse(self, node, prefix, visit):
-        """Traverse this prefix tree with recursive depth-first traversal.
-        Start at the given node with the given prefix representing its path in
-        this prefix tree and visit each node with the given visit function.
-        Time Complexity:
-            O(n) where n is the number of characters needed to be traversed and appended
-        Space Complexity:
-            O(n) where n is the number of times visited
+        return list(self._iter_traverse(self.root, "", False))
+
+    def _iter_traverse(self, node, prefix, sort):
+        """Generate each string stored in the subtree of the given node in
+        depth-first preorder, using an explicit stack instead of recursion so
+        long strings cannot exceed the interpreter's recursion limit.
         Args:
-            node - PrefixTreeNode; next node to traverse through
-            prefix - string; the prefix of the word that is being searched
-            visit - function; function to call when at the desired node"""
-        if node.is_terminal():
-            visit(prefix)
-
-        for char in node.children.keys():
-            child = node.get_child(char)
-            self._traverse(child, prefix + char, visit)
-        
+            node - PrefixTreeNode; node to start traversing from
+            prefix - string; the string spelled by the path to the node
+            sort - bool; visit children in sorted order of their characters
+        Yield:
+            string; each string that ends in the subtree"""
+        stack = [(node, prefix)]
+        while stack:
+            node, prefix = stack.pop()
+            if node.is_terminal():
+                yield prefix
+            # Push children in reverse so the first child is visited first
+            if sort:
+                children = sorted(node.child_items(), reverse=True)
+            else:
+                children = reversed(node.child_items())
+            for char, child in children:
+                stack.append((child, prefix + char))
+
+
+# Storage backends that make_prefix_tree can select
+BACKENDS = ('nodes', 'compact', 'radix', 'bytes')
+
+
+def make_prefix_tree(strings=None, backend='nodes', cache_size=None,
+                     normalizer=None):
+    """Return a new prefix tree of the given strings, if any, that stores its
+    nodes with the given backend: 'nodes' links PrefixTreeNode objects in a
+    PrefixTree, 'compact' stores nodes in parallel typed arrays (see
+    CompactPrefixTree) to save memory, 'radix' merges non-branching chains of
+    nodes (see RadixTree), and 'bytes' branches on UTF-8 bytes so that no
+    node has more than 256 children whatever the alphabet (see ByteTrie),
+    which gives a predictable fan-out but is not faster than 'nodes'. Only the 'nodes' backend supports a
+    completion cache. If a normalizer such as a KeyNormalizer is given, the
+    tree is wrapped so that strings and prefixes are normalized before they
+    reach it (see NormalizedPrefixTree). Raise ValueError for an unknown
+    backend or a cache that the backend does not support."""
+    if backend not in BACKENDS:
+        raise ValueError(f'Unknown prefix tree backend {backend!r}')
+    if backend != 'nodes' and cache_size is not None:
+        raise ValueError(f'Prefix tree backend {backend!r} does not '
+                         f'support a completion cache')
+    if normalizer is not None:
+        tree = make_prefix_tree(backend=backend, cache_size=cache_size)
+        return NormalizedPrefixTree(tree, normalizer, strings)
+    if backend == 'compact':
+        return CompactPrefixTree(strings)
+    elif backend == 'radix':
+        return RadixTree(strings)
+    elif backend == 'bytes':
+        return ByteTrie(strings)
+    return PrefixTree(strings, cache_size)
 
 
 def create_prefix_tree(strings):
@@ -140,6 +140,30 @@ class PrefixTreeTest(unittest.TestCase):
         assert node_Z.is_terminal() is True
         assert node_Z.num_children() == 0
 
+    def test_from_sorted(self):
+        strings = ['A', 'ABC', 'ABC', 'ABD', 'XYZ']
+        tree = PrefixTree.from_sorted(strings)
+        # Verify duplicates are only counted once
+        assert tree.size == 4
+        assert tree.root.num_children() == 2
+        # Verify shared prefixes reuse the same nodes
+        node_A = tree.root.get_child('A')
+        assert node_A.is_terminal() is True
+        assert node_A.num_children() == 1
+        node_B = node_A.get_child('B')
+        assert node_B.is_terminal() is False
+        assert node_B.num_children() == 2
+        assert node_B.get_child('C').is_terminal() is True
+        assert node_B.get_child('D').is_terminal() is True
+        # Verify the tree matches one built by inserting each string
+        assert tree.strings() == PrefixTree(strings).strings()
+        assert tree.top_k('A', 2) == ['A', 'ABC']
+
+    def test_from_sorted_with_unsorted_strings(self):
+        with self.assertRaises(ValueError):
+            PrefixTree.from_sorted(['ABC', 'ABD', 'AB'])
+        assert PrefixTree.from_sorted([]).is_empty() is True
+
     def test_size_and_is_empty(self):
         tree = PrefixTree()
         # Verify size after initializing tree
@@ -193,6 +217,47 @@ class PrefixTreeTest(unittest.TestCase):
         tree.insert('XYZ')
         assert tree.size == 4
 
+    def test_delete(self):
+        tree = PrefixTree(['ABC', 'ABD', 'A', 'XYZ'])
+        assert tree.root.count == 4
+        # Verify deleting a leaf string prunes only its own node
+        tree.delete('ABC')
+        assert tree.size == 3
+        assert tree.contains('ABC') is False
+        node_B = tree.root.get_child('A').get_child('B')
+        assert node_B.has_child('C') is False
+        assert node_B.has_child('D') is True
+        assert node_B.count == 1
+        # Verify deleting a string with completions keeps their nodes
+        tree.delete('A')
+        node_A = tree.root.get_child('A')
+        assert node_A.is_terminal() is False
+        assert node_A.num_children() == 1
+        assert tree.complete('A') == ['ABD']
+        # Verify deleting the last string below a branch prunes the branch
+        tree.delete('ABD')
+        assert tree.root.has_child('A') is False
+        assert tree.strings() == ['XYZ']
+        assert tree.root.count == 1
+        # Verify deleting a string that is not stored raises an error
+        with self.assertRaises(ValueError):
+            tree.delete('XY')
+        with self.assertRaises(ValueError):
+            tree.delete('ABD')
+        tree.delete('XYZ')
+        assert tree.is_empty() is True
+        assert tree.root.num_children() == 0
+
+    def test_delete_updates_scores_and_cache(self):
+        tree = PrefixTree(cache_size=10)
+        tree.insert('ABC', 9)
+        tree.insert('ABD', 3)
+        assert tree.complete('AB') == ['ABC', 'ABD']
+        tree.delete('ABC')
+        assert tree.root.best == 3
+        assert tree.top_k('A', 2) == ['ABD']
+        assert tree.complete('AB') == ['ABD']
+
     def test_contains(self):
         strings = ['ABC', 'ABD', 'A', 'XYZ']
         tree = PrefixTree(strings)
@@ -212,6 +277,20 @@ class PrefixTreeTest(unittest.TestCase):
         assert tree.contains('X') is False
         assert tree.contains('Y') is False
         assert tree.contains('Z') is False
+        # Verify strings that extend a stored string are not contained
+        assert tree.contains('ABCD') is False
+        assert tree.contains('AX') is False
+
+    def test_constructor_is_prefix_tree(self):
+        # Verify the constructor always makes a PrefixTree, which subclasses
+        # can extend, and backends are chosen with make_prefix_tree
+        class CountingPrefixTree(PrefixTree):
+            pass
+        tree = CountingPrefixTree(['ABC'])
+        assert type(tree) is CountingPrefixTree
+        assert tree.contains('ABC') is True
+        with self.assertRaises(TypeError):
+            PrefixTree(['ABC'], backend='compact')
 
     def test_complete(self):
         strings = ['ABC', 'ABD', 'A', 'XYZ']
@@ -233,6 +312,130 @@ class PrefixTreeTest(unittest.TestCase):
         assert tree.complete('Y') == []
         assert tree.complete('Z') == []
 
+    def test_complete_with_unmatched_prefix(self):
+        tree = PrefixTree(['ABC', 'ABD', 'A', 'XYZ'])
+        # Verify prefixes that diverge below a stored string match nothing
+        assert tree.complete('AZ') == []
+        assert tree.complete('ABCD') == []
+        assert tree.complete('XYW') == []
+
+    def test_iter_complete(self):
+        tree = PrefixTree(['XYZ', 'ABD', 'A', 'ABC', 'AAA'])
+        completions = tree.iter_complete('A')
+        # Verify completions are generated lazily
+        assert next(completions) == 'A'
+        assert next(completions) in ('AAA', 'ABC', 'ABD')
+        # Verify sorted completions are generated in lexicographic order
+        assert list(tree.iter_complete('A', sort=True)) == \
+            ['A', 'AAA', 'ABC', 'ABD']
+        assert list(tree.iter_complete('', sort=True)) == \
+            ['A', 'AAA', 'ABC', 'ABD', 'XYZ']
+        assert list(tree.iter_complete('B')) == []
+
+    def test_complete_long_string(self):
+        # Verify traversal does not recurse once per character
+        string = 'A' * 5000
+        tree = PrefixTree([string])
+        assert tree.complete('AAA') == [string]
+        assert tree.strings() == [string]
+
+    def test_complete_with_cache(self):
+        tree = PrefixTree(['ABC', 'ABD', 'A', 'XYZ'], cache_size=5)
+        assert tree.complete('AB') == ['ABC', 'ABD']
+        assert (tree.cache_hits, tree.cache_misses) == (0, 1)
+        # Verify repeated prefixes are answered from the cache
+        completions = tree.complete('AB')
+        assert completions == ['ABC', 'ABD']
+        assert (tree.cache_hits, tree.cache_misses) == (1, 1)
+        # Verify callers cannot modify cached results
+        completions.append('ABE')
+        assert tree.complete('AB') == ['ABC', 'ABD']
+        # Verify inserting a string invalidates the prefixes it extends
+        tree.complete('X')
+        tree.insert('ABE')
+        assert 'AB' not in tree.cache
+        assert 'X' in tree.cache
+        assert tree.complete('AB') == ['ABC', 'ABD', 'ABE']
+        assert tree.complete('X') == ['XYZ']
+
+    def test_cache_eviction(self):
+        tree = PrefixTree(['ABC', 'ABD', 'A', 'XYZ'], cache_size=4)
+        tree.complete('A')  # 3 completions
+        tree.complete('X')  # 1 completion
+        assert list(tree.cache) == ['A', 'X']
+        tree.complete('A')
+        # Verify least recently used prefixes are evicted to fit the size
+        tree.complete('Q')  # No completions, but counts as 1
+        assert list(tree.cache) == ['A', 'Q']
+        assert tree.cached_completions == 4
+        # Verify results larger than the cache are not cached
+        tree.insert('B')
+        assert len(tree.complete('')) == 5
+        assert '' not in tree.cache
+        tree.clear_cache()
+        assert len(tree.cache) == 0
+        assert tree.cache_hits == 0
+
+    def test_complete_many(self):
+        tree = PrefixTree(['XYZ', 'ABD', 'A', 'ABC', 'AXB', 'B'])
+        prefixes = ['AB', 'A', 'ABD', 'AZ', 'AX', 'X', 'XYZW', '', 'A']
+        results = tree.complete_many(prefixes)
+        # Verify every prefix is answered with its sorted completions
+        assert set(results) == set(prefixes)
+        for prefix in prefixes:
+            assert results[prefix] == sorted(tree.complete(prefix))
+        assert results['A'] == ['A', 'ABC', 'ABD', 'AXB']
+        assert results['AZ'] == []
+        assert results['XYZW'] == []
+        assert tree.complete_many([]) == {}
+
+    def test_top_k(self):
+        tree = PrefixTree()
+        scores = {'A': 5, 'ABC': 9, 'ABD': 1, 'ABE': 9, 'XYZ': 7}
+        for string, score in scores.items():
+            tree.insert(string, score)
+        # Verify completions are ranked by score, then lexicographically
+        assert tree.top_k('', 3) == ['ABC', 'ABE', 'XYZ']
+        assert tree.top_k('A', 2) == ['ABC', 'ABE']
+        assert tree.top_k('A', 10) == ['ABC', 'ABE', 'A', 'ABD']
+        assert tree.top_k('AB', 3, with_scores=True) == \
+            [('ABC', 9), ('ABE', 9), ('ABD', 1)]
+        assert tree.top_k('X', 0) == []
+        assert tree.top_k('B', 3) == []
+        assert tree.top_k('AZ', 3) == []
+
+    def test_top_k_with_changed_scores(self):
+        tree = PrefixTree()
+        tree.insert('ABC', 9)
+        tree.insert('ABD', 3)
+        # Verify lowering a score updates the best scores cached in nodes
+        tree.insert('ABC', 1)
+        assert tree.size == 2
+        assert tree.root.best == 3
+        assert tree.top_k('A', 1) == ['ABD']
+        # Verify raising a score again ranks the string first
+        tree.insert('ABC', 4)
+        assert tree.top_k('A', 2, with_scores=True) == [('ABC', 4), ('ABD', 3)]
+        # Verify re-inserting without a score keeps the stored score
+        tree.insert('ABC')
+        tree.insert('ABE')
+        assert tree.size == 3
+        assert tree.top_k('A', 3, with_scores=True) == \
+            [('ABC', 4), ('ABD', 3), ('ABE', 0)]
+
+    def test_fuzzy_complete(self):
+        tree = PrefixTree(['ABC', 'ABD', 'A', 'XYZ', 'AXYZ'])
+        # Verify zero edits matches exact completions
+        assert tree.fuzzy_complete('AB', 0) == ['ABC', 'ABD']
+        # Verify substitutions, insertions and deletions within the budget
+        assert tree.fuzzy_complete('AQ', 1) == ['A', 'ABC', 'ABD', 'AXYZ']
+        assert tree.fuzzy_complete('YZ', 1) == ['XYZ']
+        assert tree.fuzzy_complete('ACB', 1) == ['ABC', 'ABD']
+        assert tree.fuzzy_complete('XZ', 1) == ['XYZ']
+        assert tree.fuzzy_complete('QQQ', 1) == []
+        # Verify a budget as long as the prefix matches every string
+        self.assertCountEqual(tree.fuzzy_complete('QQ', 2), tree.strings())
+
     def test_strings(self):
         tree = PrefixTree()
         input_strings = []  # Strings that have been inserted into the tree
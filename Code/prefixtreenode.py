@@ -1,25 +1,57 @@
 #!python3
 
+from bisect import bisect_left
+from types import MappingProxyType
+
 
 class PrefixTreeNode:
     """PrefixTreeNode: A node for use in a prefix tree that stores a single
     character from a string and a structure of children nodes below it, which
     associates the next character in a string to the next node along its path from
-    the tree's root node to a terminal node that marks the end of the string."""
+    the tree's root node to a terminal node that marks the end of the string.
+    Like the nodes of an adaptive radix tree, the structure adapts to the
+    number of children: most nodes have few children, so up to SMALL_CHILDREN
+    of them are kept in a pair of tuples of characters and nodes in sorted
+    order, which are smaller than a dict and faster to search than hashing
+    the character. Nodes with more children switch to a dict."""
+
+    # Type of the structure that the children property gives a read-only view of
+    CHILDREN_TYPE = dict
+
+    # Maximum number of children kept in sorted tuples before using a dict
+    SMALL_CHILDREN = 4
 
-    # Choose an appropriate type of data structure to store children nodes in
-    # Hint: Choosing list or dict affects implementation of all child methods
-    CHILDREN_TYPE = dict  # or dict
+    # Declare fixed attributes so nodes do not each carry an instance __dict__
+    __slots__ = ('character', '_keys', '_nodes', 'terminal', 'score', 'best',
+                 'count')
 
     def __init__(self, character=None):
         """Initialize this prefix tree node with the given character value, an
         empty structure of children nodes, and a boolean terminal property."""
         # Character that this node represents
         self.character = character
-        # Data structure to associate character keys to children node values
-        self.children = PrefixTreeNode.CHILDREN_TYPE()
+        # Sorted tuple of children's characters, or None if _nodes is a dict
+        self._keys = ()
+        # Tuple of children nodes in the order of _keys, or a dict that
+        # associates character keys to children node values
+        self._nodes = ()
         # Marks if this node terminates a string in the prefix tree
         self.terminal = False
+        # Score of the string this node terminates, such as its frequency
+        self.score = 0
+        # Maximum score of any string that terminates in this node's subtree
+        self.best = float('-inf')
+        # Number of strings that terminate in this node's subtree
+        self.count = 0
+
+    @property
+    def children(self):
+        """Return a read-only mapping that associates the characters of this
+        node's children to the children nodes. Use set_child, add_child and
+        remove_child to change them."""
+        if self._keys is None:
+            return MappingProxyType(self._nodes)
+        return MappingProxyType(dict(zip(self._keys, self._nodes)))
 
     def is_terminal(self):
         """Return True if this prefix tree node terminates a string."""
@@ -27,32 +59,115 @@ class PrefixTreeNode:
 
     def num_children(self):
         """Return the number of children nodes this prefix tree node has."""
-        return len(self.children)
+        return len(self._nodes)
+
+    def find_child(self, character):
+        """Return this prefix tree node's child node that represents the given
+        character, or None if it is not amongst its children. Unlike get_child,
+        this looks the character up once and never raises an exception.
+        Time Complexity:
+            O(1) since a small structure has at most SMALL_CHILDREN entries"""
+        keys = self._keys
+        if keys is None:
+            return self._nodes.get(character)
+        # Scanning at most SMALL_CHILDREN keys twice in C with in and index
+        # is faster than a binary search or a single scan in Python
+        if character in keys:
+            return self._nodes[keys.index(character)]
+        return None
 
     def has_child(self, character):
         """Return True if this prefix tree node has a child node that
         represents the given character amongst its children."""
-        try:
-            self.children[character]
-            return True
-        except KeyError:
-            return False
+        return self.find_child(character) is not None
 
     def get_child(self, character):
         """Return this prefix tree node's child node that represents the given
         character if it is amongst its children, or raise ValueError if not."""
-        if self.has_child(character):
-            return self.children[character]
-        else:
+        child = self.find_child(character)
+        if child is None:
             raise ValueError(f'No child exists for character {character!r}')
+        return child
+
+    def set_child(self, character, child_node):
+        """Add the given character and child node as a child of this node, or
+        replace the child node that represents the character if it has one."""
+        keys = self._keys
+        if keys is None:
+            self._nodes[character] = child_node
+            return
+        if not keys:
+            self._keys = (character,)
+            self._nodes = (child_node,)
+            return
+        nodes = self._nodes
+        index = bisect_left(keys, character)
+        if index < len(keys) and keys[index] == character:
+            self._nodes = nodes[:index] + (child_node,) + nodes[index + 1:]
+        elif len(keys) < PrefixTreeNode.SMALL_CHILDREN:
+            self._keys = keys[:index] + (character,) + keys[index:]
+            self._nodes = nodes[:index] + (child_node,) + nodes[index:]
+        else:
+            # Switch to a dict once the tuples would be too long to scan
+            self._nodes = dict(zip(keys, nodes))
+            self._nodes[character] = child_node
+            self._keys = None
 
     def add_child(self, character, child_node):
         """Add the given character and child node as a child of this node, or
         raise ValueError if given character is amongst this node's children."""
-        if not self.has_child(character):
-            self.children[character] = child_node
-        else:
+        if self.find_child(character) is not None:
             raise ValueError(f'Child exists for character {character!r}')
+        self.set_child(character, child_node)
+
+    def remove_child(self, character):
+        """Remove the child node that represents the given character from this
+        node's children, or raise ValueError if it is not amongst them."""
+        if self.find_child(character) is None:
+            raise ValueError(f'No child exists for character {character!r}')
+        keys = self._keys
+        if keys is None:
+            del self._nodes[character]
+            # Switch back to tuples well below the limit, so that removing and
+            # adding a child at the limit does not switch every time
+            if len(self._nodes) <= PrefixTreeNode.SMALL_CHILDREN // 2:
+                items = sorted(self._nodes.items())
+                self._keys = tuple(char for char, _ in items)
+                self._nodes = tuple(child for _, child in items)
+            return
+        index = bisect_left(keys, character)
+        self._keys = keys[:index] + keys[index + 1:]
+        self._nodes = self._nodes[:index] + self._nodes[index + 1:]
+
+    def child_items(self):
+        """Return a reversible sequence of (character, child node) pairs of
+        this node's children, in sorted order of their characters while they
+        fit in tuples and in the order they were added after that."""
+        if self._keys is None:
+            return self._nodes.items()
+        return tuple(zip(self._keys, self._nodes))
+
+    def child_nodes(self):
+        """Return an iterable of this node's children nodes."""
+        if self._keys is None:
+            return self._nodes.values()
+        return self._nodes
+
+    def copy(self):
+        """Return a new node with the same properties as this node and its own
+        structure of children that refers to the same children nodes."""
+        node = PrefixTreeNode(self.character)
+        node._keys = self._keys
+        # Tuples are never changed in place, so only a dict must be copied
+        if self._keys is None:
+            node._nodes = dict(self._nodes)
+        else:
+            node._nodes = self._nodes
+        node.terminal = self.terminal
+        node.score = self.score
+        node.best = self.best
+        node.count = self.count
+        return node
 
     def __repr__(self):
         """Return a code representation of this prefix tree node."""
@@ -0,0 +1,149 @@
+#!python3
+
+from autocomplete_benchmark import generate_vocabulary
+from gcpause import paused_gc
+from prefixtreenode import PrefixTreeNode
+import argparse
+import time
+import tracemalloc
+
+
+class LegacyPrefixTreeNode:
+    """LegacyPrefixTreeNode: The previous PrefixTreeNode, which always kept
+    its children in a dict and looked a child up twice, through has_child and
+    then by indexing the dict, raising ValueError if it was missing. It is kept
+    here only as a baseline to compare PrefixTreeNode against."""
+
+    __slots__ = ('character', 'children', 'terminal')
+
+    def __init__(self, character=None):
+        self.character = character
+        self.children = {}
+        self.terminal = False
+
+    def has_child(self, character):
+        try:
+            self.children[character]
+            return True
+        except KeyError:
+            return False
+
+    def get_child(self, character):
+        if self.has_child(character):
+            return self.children[character]
+        else:
+            raise ValueError(f'No child exists for character {character!r}')
+
+    def add_child(self, character, child_node):
+        if not self.has_child(character):
+            self.children[character] = child_node
+        else:
+            raise ValueError(f'Child exists for character {character!r}')
+
+
+def build_legacy(words):
+    """Return the root of a tree of legacy nodes that stores the given words,
+    built the way PrefixTree.insert used to build it."""
+    root = LegacyPrefixTreeNode()
+    for word in words:
+        node = root
+        for char in word:
+            try:
+                node = node.get_child(char)
+            except ValueError:
+                child = LegacyPrefixTreeNode(char)
+                node.add_child(char, child)
+                node = child
+        node.terminal = True
+    return root
+
+
+def contains_legacy(root, words):
+    """Return the number of the given words stored below the given root of a
+    tree of legacy nodes, searched the way PrefixTree used to search."""
+    found = 0
+    for word in words:
+        node = root
+        for char in word:
+            if not node.has_child(char):
+                break
+            node = node.get_child(char)
+        else:
+            found += node.terminal
+    return found
+
+
+def build(words):
+    """Return the root of a tree of nodes that stores the given words."""
+    root = PrefixTreeNode()
+    for word in words:
+        node = root
+        for char in word:
+            child = node.find_child(char)
+            if child is None:
+                child = PrefixTreeNode(char)
+                node.set_child(char, child)
+            node = child
+        node.terminal = True
+    return root
+
+
+def contains(root, words):
+    """Return the number of the given words stored below the given root."""
+    found = 0
+    for word in words:
+        node = root
+        for char in word:
+            node = node.find_child(char)
+            if node is None:
+                break
+        else:
+            found += node.terminal
+    return found
+
+
+def measure(build_function, contains_function, words, queries):
+    """Return the seconds to build a tree of the given words, the KiB of
+    memory it allocates, and the seconds to look up the given queries. The
+    garbage collector is paused while building, as PrefixTree.from_sorted
+    does."""
+    tracemalloc.start()
+    root = build_function(words)
+    memory = tracemalloc.get_traced_memory()[0] // 1024
+    tracemalloc.stop()
+    # Build again without tracing memory, which slows allocation down
+    del root
+    with paused_gc():
+        start_time = time.perf_counter()
+        root = build_function(words)
+        build_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    contains_function(root, queries)
+    contains_time = time.perf_counter() - start_time
+    return build_time, memory, contains_time
+
+
+def main():
+    """Read command-line arguments and compare building and searching trees
+    of PrefixTreeNode and LegacyPrefixTreeNode nodes."""
+    parser = argparse.ArgumentParser(
+        description='Compare PrefixTreeNode with the previous dict-only node.')
+    parser.add_argument('--size', type=int, default=200000,
+                        help='number of words to store')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    words = generate_vocabulary(args.size, args.seed)
+    # Query stored words and, as misses, the same words with a suffix
+    queries = words + [word + 'q' for word in words]
+    for name, build_function, contains_function in (
+            ('legacy', build_legacy, contains_legacy),
+            ('adaptive', build, contains)):
+        build_time, memory, contains_time = measure(
+            build_function, contains_function, words, queries)
+        print('{:>8}: build {:.3f} sec, {} KiB, contains {:.3f} sec'
+              .format(name, build_time, memory, contains_time))
+
+
+if __name__ == '__main__':
+    main()
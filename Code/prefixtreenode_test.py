@@ -1,6 +1,7 @@
 #!python3
 
 from prefixtreenode import PrefixTreeNode
+from types import MappingProxyType
 import unittest
 
 
@@ -13,7 +14,7 @@ class PrefixTreeNodeTest(unittest.TestCase):
         assert isinstance(node.character, str)
         assert node.character is character
         # Verify children nodes structure
-        assert isinstance(node.children, PrefixTreeNode.CHILDREN_TYPE)
+        assert isinstance(node.children, MappingProxyType)
         assert len(node.children) == 0
         assert node.children == PrefixTreeNode.CHILDREN_TYPE()
         # Verify terminal boolean
@@ -49,3 +50,59 @@ class PrefixTreeNodeTest(unittest.TestCase):
         # Verify adding node 'C' as child to node 'A' again raises error
         with self.assertRaises(ValueError):
             node_A.add_child('C', node_C)
+        # Remove node 'B' and verify node 'A' only has node 'C' as child
+        node_A.remove_child('B')
+        assert node_A.num_children() == 1
+        assert node_A.has_child('B') is False
+        assert node_A.has_child('C') is True
+        # Verify removing node 'B' from node 'A' again raises error
+        with self.assertRaises(ValueError):
+            node_A.remove_child('B')
+
+    def test_find_child(self):
+        node_A = PrefixTreeNode('A')
+        # Verify finding a missing child returns None instead of raising
+        assert node_A.find_child('B') is None
+        node_B = PrefixTreeNode('B')
+        node_A.add_child('B', node_B)
+        assert node_A.find_child('B') is node_B
+        assert node_A.find_child('C') is None
+        # Verify setting a child replaces an existing child
+        node_B2 = PrefixTreeNode('B')
+        node_A.set_child('B', node_B2)
+        assert node_A.num_children() == 1
+        assert node_A.find_child('B') is node_B2
+
+    def test_small_and_large_children(self):
+        node = PrefixTreeNode('A')
+        characters = 'HCFADGBE'
+        children = {char: PrefixTreeNode(char) for char in characters}
+        for count, char in enumerate(characters, start=1):
+            node.add_child(char, children[char])
+            assert node.num_children() == count
+            # Verify small structures keep children in sorted order
+            if count <= PrefixTreeNode.SMALL_CHILDREN:
+                assert [char for char, _ in node.child_items()] == \
+                    sorted(characters[:count])
+        # Verify all children are found after switching to a large structure
+        for char in characters:
+            assert node.find_child(char) is children[char]
+        assert node.children == children
+        assert set(node.child_nodes()) == set(children.values())
+        # Verify children cannot be changed through the read-only view
+        with self.assertRaises(TypeError):
+            node.children['Z'] = PrefixTreeNode('Z')
+        # Verify copies have their own structure of children
+        copy = node.copy()
+        copy.remove_child('A')
+        assert node.find_child('A') is children['A']
+        # Verify children are still found after switching back to small
+        for char in 'HCFADG':
+            node.remove_child(char)
+        assert node.children == {'B': children['B'], 'E': children['E']}
+        with self.assertRaises(TypeError):
+            del node.children['B']
+        assert [char for char, _ in node.child_items()] == ['B', 'E']
+        node.add_child('A', children['A'])
+        assert node.get_child('A') is children['A']
+        assert [char for char, _ in node.child_items()] == ['A', 'B', 'E']
@@ -1,21 +1,34 @@
 #!python
 
-from binaryheap import BinaryMinHeap
+from binaryheap import BinaryMinHeap, IndexedBinaryMinHeap
+import itertools
 
 
 class PriorityQueue(object):
     """PriorityQueue: a partially ordered queue with methods to enqueue items
     in priority order and to access and dequeue its highest priority item.
-    Item pairs are stored in a binary min heap for its efficient operations."""
+    Items are stored in a d-ary min heap for its efficient operations, keyed
+    by their priorities, so items themselves are never compared.
+    Items of equal priority leave in no particular order, unless the queue is
+    stable: then each item is keyed by its priority and a sequence number that
+    counts up as items are enqueued, so items of equal priority leave first in,
+    first out, and ties are broken by comparing two integers."""
 
-    def __init__(self):
-        """Initialize this priority queue."""
-        # Initialize new binary min heap to store items in this priority queue
-        self.heap = BinaryMinHeap()
+    # Type of heap to store items in, keyed by their priorities
+    HEAP_TYPE = BinaryMinHeap
+
+    def __init__(self, d=2, stable=False):
+        """Initialize this priority queue with a heap that has the given number
+        of children per node (see BinaryMinHeap), which orders items of equal
+        priority first in, first out if stable is True."""
+        # Initialize new d-ary min heap to store items in this priority queue
+        self.heap = self.HEAP_TYPE(d=d)
+        # Count enqueued items to break ties between priorities, if stable
+        self.sequence = itertools.count() if stable else None
 
     def __repr__(self):
         """Return a string representation of this priority queue."""
-        return 'PriorityQueue({} items, front={})'.format(self.size(), self.front())
+        return 'PriorityQueue({} items, front={})'.format(self.length(), self.front())
 
     def is_empty(self):
         """Return True if this priority queue is empty, or False otherwise."""
@@ -28,13 +41,14 @@ class PriorityQueue(object):
     def enqueue(self, item, priority):
         """Insert the given item into this priority queue in order according to
         the given priority."""
-        # Insert given item into heap in order according to given priority
-        self.heap.insert((priority, item))
+        # Insert given item into heap keyed by given priority, which needs no
+        # (priority, item) pair to be created
+        self.heap.insert_keyed(item, self._key(priority))
 
     def front(self):
         """Return the item at the front of this priority queue without removing
         it, or None if this priority queue is empty."""
-        if self.size() == 0:
+        if self.length() == 0:
             return None
         #  Return minimum item from heap
         return self.heap.get_min()
@@ -42,27 +56,69 @@ class PriorityQueue(object):
     def dequeue(self):
         """Remove and return the item at the front of this priority queue,
         or raise ValueError if this priority queue is empty."""
-        if self.size() == 0:
+        if self.length() == 0:
             raise ValueError('Priority queue is empty and has no front item')
-        # TODO: Remove and return minimum item from heap
+        # Remove and return minimum item from heap
         return self.heap.delete_min()
 
     def push_pop(self, item, priority):
         """Remove and return the item at the front of this priority queue,
         and insert the given item in order according to the given priority.
         This method is more efficient than calling dequeue and then enqueue."""
-        if self.size() == 0:
+        if self.length() == 0:
             raise ValueError('Priority queue is empty and has no front item')
         # Replace and return minimum item from heap
-        
-        min_item = self.heap.items[0]
-        self.heap.items[0] = (priority, item)
+        return self.heap.replace_min_keyed(item, self._key(priority))
+
+    def _key(self, priority):
+        """Return the key to order an item with the given priority by, which
+        is the priority and the next sequence number if this queue is stable."""
+        if self.sequence is None:
+            return priority
+        return (priority, next(self.sequence))
+
+    def _priority(self, key):
+        """Return the priority in the given key of an item."""
+        return key if self.sequence is None else key[0]
+
+
+class IndexedPriorityQueue(PriorityQueue):
+    """IndexedPriorityQueue: a priority queue that also tracks where each item
+    is stored in its heap (see IndexedBinaryMinHeap), so an item's priority
+    can be changed and any item can be removed in O(log n) time, instead of
+    enqueuing it again and discarding stale duplicates when they reach the
+    front. Items must be hashable and each item can be enqueued only once:
+    enqueue raises ValueError if the item is already in the queue (see
+    update_priority)."""
+
+    # Type of heap to store items in, which maps items to their indexes
+    HEAP_TYPE = IndexedBinaryMinHeap
+
+    def __repr__(self):
+        """Return a string representation of this priority queue."""
+        return 'IndexedPriorityQueue({} items, front={})'.format(self.length(), self.front())
+
+    def contains(self, item):
+        """Return True if the given item is in this priority queue."""
+        return self.heap.contains(item)
+
+    def priority(self, item):
+        """Return the priority of the given item, or raise ValueError if it is
+        not in this priority queue."""
+        return self._priority(self.heap.get_key(item))
+
+    def update_priority(self, item, priority):
+        """Change the priority of the given item in this priority queue, or
+        raise ValueError if it is not in this priority queue. If this queue is
+        stable, the item leaves after other items of equal priority, as if it
+        was enqueued again."""
+        self.heap.update_key(item, self._key(priority))
+
+    def remove(self, item):
+        """Remove the given item from this priority queue and return its
+        priority, or raise ValueError if it is not in this priority queue."""
+        return self._priority(self.heap.delete(item))
 
-        if self.heap._last_index != 0:
-            self.heap._bubble_down(0)
 
-        return min_item
-        
 class PriorityStack(PriorityQueue):
     pass
-
@@ -0,0 +1,99 @@
+#!python
+
+from priorityqueue import PriorityQueue, IndexedPriorityQueue
+import random
+import unittest
+
+
+class TestPriorityQueue(unittest.TestCase):
+    def test_empty_queue(self):
+        queue = PriorityQueue()
+        assert queue.length() == 0
+        assert queue.is_empty() is True
+        assert queue.front() is None
+        with self.assertRaises(ValueError):
+            queue.dequeue()
+        with self.assertRaises(ValueError):
+            queue.push_pop('A', 1)
+
+    def test_enqueue_and_dequeue_many_items(self):
+        priorities = random.sample(range(1000), 100)
+        for d in (2, 4, 8):
+            queue = PriorityQueue(d)
+            for priority in priorities:
+                queue.enqueue('item {}'.format(priority), priority)
+            assert queue.length() == len(priorities)
+            assert queue.front() == 'item {}'.format(min(priorities))
+            for priority in sorted(priorities):
+                assert queue.dequeue() == 'item {}'.format(priority)
+            assert queue.is_empty() is True
+
+    def test_items_are_not_compared(self):
+        queue = PriorityQueue()
+        # Verify items that cannot be compared are ordered by priority
+        queue.enqueue({'name': 'B'}, 2)
+        queue.enqueue({'name': 'A'}, 1)
+        queue.enqueue({'name': 'C'}, 3)
+        assert queue.front() == {'name': 'A'}
+        assert queue.push_pop({'name': 'D'}, 0) == {'name': 'A'}
+        assert [queue.dequeue()['name'] for _ in range(3)] == ['D', 'B', 'C']
+
+    def test_stable_order_of_equal_priorities(self):
+        for d in (2, 4, 8):
+            queue = PriorityQueue(d, stable=True)
+            # Enqueue items with few distinct priorities, so most are tied
+            jobs = [({'job': number}, random.randrange(3))
+                    for number in range(200)]
+            for job, priority in jobs:
+                queue.enqueue(job, priority)
+            # Verify items of equal priority are dequeued first in, first out
+            expected = [job for job, _ in
+                        sorted(jobs, key=lambda pair: pair[1])]
+            assert [queue.dequeue() for _ in jobs] == expected
+
+    def test_stable_push_pop(self):
+        queue = PriorityQueue(stable=True)
+        queue.enqueue('A', 1)
+        queue.enqueue('B', 1)
+        assert queue.push_pop('C', 1) == 'A'
+        assert [queue.dequeue() for _ in range(2)] == ['B', 'C']
+
+
+class TestIndexedPriorityQueue(unittest.TestCase):
+    def test_update_priority_and_remove(self):
+        queue = IndexedPriorityQueue()
+        for priority, job in enumerate(['A', 'B', 'C', 'D', 'E']):
+            queue.enqueue(job, priority)
+        assert queue.contains('C') is True
+        assert queue.contains('X') is False
+        # Verify a job cannot be enqueued twice
+        with self.assertRaises(ValueError):
+            queue.enqueue('C', 0)
+        queue.update_priority('D', -1)
+        assert queue.priority('D') == -1
+        assert queue.front() == 'D'
+        queue.update_priority('D', 10)
+        assert queue.front() == 'A'
+        assert queue.remove('A') == 0
+        assert queue.contains('A') is False
+        assert queue.length() == 4
+        with self.assertRaises(ValueError):
+            queue.remove('A')
+        with self.assertRaises(ValueError):
+            queue.update_priority('A', 1)
+        assert [queue.dequeue() for _ in range(4)] == ['B', 'C', 'E', 'D']
+        assert queue.is_empty() is True
+
+    def test_stable_update_priority_and_remove(self):
+        queue = IndexedPriorityQueue(stable=True)
+        for job in ['A', 'B', 'C', 'D']:
+            queue.enqueue(job, 1)
+        assert queue.priority('B') == 1
+        # Verify an updated item leaves after items of equal priority
+        queue.update_priority('A', 1)
+        assert queue.remove('C') == 1
+        assert [queue.dequeue() for _ in range(3)] == ['B', 'D', 'A']
+
+
+if __name__ == '__main__':
+    unittest.main()
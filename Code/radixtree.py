@@ -0,0 +1,197 @@
+#!python3
+
+
+class RadixTreeNode:
+    """RadixTreeNode: A node for use in a radix tree that stores the substring
+    on the edge from its parent node and a structure of children nodes below
+    it, which associates the first character of each child's edge substring to
+    that child node. Unlike a PrefixTreeNode, a chain of nodes that each have a
+    single child is merged into one node with a longer edge substring."""
+
+    __slots__ = ('label', 'children', 'terminal')
+
+    def __init__(self, label=''):
+        """Initialize this radix tree node with the given edge substring, an
+        empty structure of children nodes, and a boolean terminal property."""
+        # Substring on the edge from this node's parent to this node
+        self.label = label
+        # Dict to associate first characters of edges to children nodes
+        self.children = {}
+        # Marks if this node terminates a string in the radix tree
+        self.terminal = False
+
+    def is_terminal(self):
+        """Return True if this radix tree node terminates a string."""
+        return self.terminal
+
+    def num_children(self):
+        """Return the number of children nodes this radix tree node has."""
+        return len(self.children)
+
+    def __repr__(self):
+        """Return a code representation of this radix tree node."""
+        return f'RadixTreeNode({self.label!r})'
+
+    def __str__(self):
+        """Return a string view of this radix tree node."""
+        return f'({self.label})'
+
+
+class RadixTree:
+    """RadixTree: A path-compressed prefix tree with the same interface as
+    PrefixTree. Each edge stores a substring rather than a single character,
+    so a string is stored along a path whose length is at most the number of
+    branching points above it, not the number of its characters. Inserting a
+    string that diverges in the middle of an edge splits that edge in two."""
+
+    def __init__(self, strings=None):
+        """Initialize this radix tree and insert the given strings, if any."""
+        # Create a new root node with an empty edge substring
+        self.root = RadixTreeNode()
+        # Count the number of strings inserted into the tree
+        self.size = 0
+        # Insert each string, if any were given
+        if strings is not None:
+            for string in strings:
+                self.insert(string)
+
+    def __repr__(self):
+        """Return a string representation of this radix tree."""
+        return f'RadixTree({self.strings()!r})'
+
+    def is_empty(self):
+        """Return True if this radix tree is empty (contains no strings)."""
+        return self.size == 0
+
+    def contains(self, string):
+        """Return True if this radix tree contains the given string.
+            Time Complexity:
+                O(n) where n is the length of the string that is given
+            Args:
+                string - string; input string to check
+            return:
+                bool"""
+        node = self.root
+        index = 0
+        while index < len(string):
+            child = node.children.get(string[index])
+            if child is None or not string.startswith(child.label, index):
+                return False
+            index += len(child.label)
+            node = child
+        return node.is_terminal()
+
+    def insert(self, string):
+        """Insert the given string into this radix tree, splitting the edge
+        where the string diverges from a stored string, if any.
+            Time Complexity:
+                O(n) where n is the length of the string that is given
+            Space Complexity:
+                O(1) at most two new nodes are created
+            Args:
+                string - string; input string to insert"""
+        node = self.root
+        index = 0
+
+        while index < len(string):
+            child = node.children.get(string[index])
+            if child is None:
+                # Add the rest of the string as a single new leaf edge
+                leaf = RadixTreeNode(string[index:])
+                node.children[string[index]] = leaf
+                node = leaf
+                break
+
+            label = child.label
+            if string.startswith(label, index):
+                # The whole edge matches so continue below the child
+                index += len(label)
+                node = child
+                continue
+
+            # Split the edge where the string diverges from its substring
+            common = 1
+            limit = min(len(label), len(string) - index)
+            while common < limit and label[common] == string[index + common]:
+                common += 1
+            middle = RadixTreeNode(label[:common])
+            child.label = label[common:]
+            middle.children[child.label[0]] = child
+            node.children[string[index]] = middle
+            index += common
+            node = middle
+
+        if not node.is_terminal():
+            node.terminal = True
+            self.size += 1
+
+    def _find_node(self, prefix):
+        """Return a pair containing the shallowest node whose path from the
+        root spells a string that starts with the given prefix and that string,
+        or (None, None) if no string in this radix tree starts with the prefix.
+        Args:
+            prefix - string; given prefix to search for
+        Return:
+            tuple; node [0] and the string its path spells [1]"""
+        node = self.root
+        index = 0
+        while index < len(prefix):
+            child = node.children.get(prefix[index])
+            if child is None:
+                return None, None
+            label = child.label
+            if prefix.startswith(label, index):
+                index += len(label)
+                node = child
+            elif label.startswith(prefix[index:]):
+                # The prefix ends in the middle of this child's edge
+                return child, prefix[:index] + label
+            else:
+                return None, None
+        return node, prefix
+
+    def complete(self, prefix):
+        """Return a list of all strings stored in this radix tree that start
+        with the given prefix string.
+        Args:
+            prefix - string; given prefix of the words you want to return
+        Return:
+            completions - list; a list of all the words in the tree with the given prefix"""
+        return list(self.iter_complete(prefix))
+
+    def iter_complete(self, prefix, sort=False):
+        """Generate all strings stored in this radix tree that start with the
+        given prefix string, one at a time.
+        Args:
+            prefix - string; given prefix of the words you want to generate
+            sort - bool; generate the words in lexicographic order if True
+        Yield:
+            string; each word in the tree with the given prefix"""
+        node, path = self._find_node(prefix)
+        if node is not None:
+            yield from self._iter_traverse(node, path, sort)
+
+    def strings(self):
+        """Return a list of all strings stored in this radix tree."""
+        return list(self._iter_traverse(self.root, '', False))
+
+    def _iter_traverse(self, node, prefix, sort):
+        """Generate each string stored in the subtree of the given node in
+        depth-first preorder, using an explicit stack of nodes.
+        Args:
+            node - RadixTreeNode; node to start traversing from
+            prefix - string; the string spelled by the path to the node
+            sort - bool; visit children in sorted order of their edges
+        Yield:
+            string; each string that ends in the subtree"""
+        stack = [(node, prefix)]
+        while stack:
+            node, prefix = stack.pop()
+            if node.is_terminal():
+                yield prefix
+            if sort:
+                children = sorted(node.children.items(), reverse=True)
+            else:
+                children = reversed(node.children.items())
+            for _, child in children:
+                stack.append((child, prefix + child.label))
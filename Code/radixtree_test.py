@@ -0,0 +1,92 @@
+#!python3
+
+from radixtree import RadixTree, RadixTreeNode
+from prefixtree import PrefixTree, make_prefix_tree
+import unittest
+
+
+class RadixTreeTest(unittest.TestCase):
+
+    def test_init_and_properties(self):
+        tree = RadixTree()
+        assert tree.size == 0
+        assert tree.is_empty() is True
+        assert isinstance(tree.root, RadixTreeNode)
+        assert tree.root.label == ''
+        assert tree.root.is_terminal() is False
+        assert tree.root.num_children() == 0
+
+    def test_backend_selection(self):
+        tree = make_prefix_tree(['ABC'], backend='radix')
+        assert isinstance(tree, RadixTree)
+        assert tree.contains('ABC') is True
+
+    def test_insert_compresses_chains(self):
+        tree = RadixTree()
+        tree.insert('ABC')
+        # Verify the whole string is stored on a single edge
+        assert tree.root.num_children() == 1
+        node_ABC = tree.root.children['A']
+        assert node_ABC.label == 'ABC'
+        assert node_ABC.is_terminal() is True
+        assert node_ABC.num_children() == 0
+
+    def test_insert_splits_edges(self):
+        tree = RadixTree()
+        tree.insert('ABC')
+        tree.insert('ABD')
+        # Verify edge 'ABC' was split into 'AB' with children 'C' and 'D'
+        node_AB = tree.root.children['A']
+        assert node_AB.label == 'AB'
+        assert node_AB.is_terminal() is False
+        assert node_AB.num_children() == 2
+        assert node_AB.children['C'].label == 'C'
+        assert node_AB.children['D'].label == 'D'
+        # Insert substring that ends in the middle of edge 'AB'
+        tree.insert('A')
+        node_A = tree.root.children['A']
+        assert node_A.label == 'A'
+        assert node_A.is_terminal() is True
+        assert node_A.children['B'] is node_AB
+        assert node_AB.label == 'B'
+        assert tree.size == 3
+
+    def test_size_with_repeated_insert(self):
+        tree = RadixTree()
+        for string in ['A', 'A', 'ABC', 'ABC', 'ABD', 'XYZ', 'ABD']:
+            tree.insert(string)
+        assert tree.size == 4
+
+    def test_contains(self):
+        tree = RadixTree(['ABC', 'ABD', 'A', 'XYZ'])
+        assert tree.contains('ABC') is True
+        assert tree.contains('ABD') is True
+        assert tree.contains('A') is True
+        assert tree.contains('XYZ') is True
+        assert tree.contains('AB') is False
+        assert tree.contains('ABCD') is False
+        assert tree.contains('XY') is False
+        assert tree.contains('XYW') is False
+        assert tree.contains('B') is False
+
+    def test_complete(self):
+        tree = RadixTree(['ABC', 'ABD', 'A', 'XYZ'])
+        assert tree.complete('A') == ['A', 'ABC', 'ABD']
+        assert tree.complete('AB') == ['ABC', 'ABD']
+        assert tree.complete('ABC') == ['ABC']
+        assert tree.complete('X') == ['XYZ']
+        assert tree.complete('XY') == ['XYZ']
+        assert tree.complete('XYW') == []
+        assert tree.complete('ABCD') == []
+        assert tree.complete('B') == []
+
+    def test_strings_match_prefix_tree(self):
+        strings = 'Shelly sells seashells by the sea shore'.split()
+        tree = RadixTree(strings)
+        self.assertCountEqual(tree.strings(), PrefixTree(strings).strings())
+        for string in strings:
+            assert tree.contains(string) is True
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+#!python3
+
+from array import array
+from bisect import bisect_right
+
+
+class SuffixIndex:
+    """SuffixIndex: A generalized suffix array over a vocabulary that finds the
+    words containing a fragment anywhere, not only at their start as in a
+    PrefixTree. The words are joined into one text, separated by a character
+    that cannot appear in them, and every position inside a word is sorted by
+    the suffix of that word which starts there. All suffixes that start with a
+    fragment are then contiguous in the sorted array, so a binary search finds
+    the first one and the longest common prefix (LCP) of adjacent suffixes
+    finds the rest without comparing them to the fragment."""
+
+    # Character that separates words in the text and cannot appear in them
+    SEPARATOR = '\0'
+
+    def __init__(self, vocabulary):
+        """Initialize this index with the unique words in the given vocabulary,
+        or raise ValueError if a word contains the separator character.
+        Time Complexity:
+            O(n*log(n)*w) where n is the total number of characters in the
+            words and w is the length of the longest word
+        Space Complexity:
+            O(n*w) while sorting, then O(n) for the arrays"""
+        self.words = list(dict.fromkeys(vocabulary))
+        for word in self.words:
+            if SuffixIndex.SEPARATOR in word:
+                raise ValueError(f'Word {word!r} contains the separator')
+        separator = SuffixIndex.SEPARATOR
+        self.text = separator.join(self.words) + separator
+        # Position in the text where each word starts
+        self.starts = array('i')
+        # Positions in the text of every suffix of every word
+        positions = []
+        start = 0
+        for word in self.words:
+            self.starts.append(start)
+            positions.extend(range(start, start + len(word)))
+            start += len(word) + 1
+        # Sort positions by the suffix of the word that starts there; sorting
+        # by the rest of the text would be equivalent since the separator sorts
+        # before every other character, but would make much longer keys
+        text = self.text
+        positions.sort(key=lambda position:
+                       text[position:text.index(separator, position)])
+        self.suffixes = array('i', positions)
+        self.lcp = self._longest_common_prefixes()
+
+    def _longest_common_prefixes(self):
+        """Return an array whose entry i is the length of the longest common
+        prefix of the suffixes at indexes i-1 and i of the suffix array, and
+        whose first entry is 0."""
+        text = self.text
+        separator = SuffixIndex.SEPARATOR
+        lcp = array('i', [0] * len(self.suffixes))
+        for index in range(1, len(self.suffixes)):
+            previous = self.suffixes[index - 1]
+            current = self.suffixes[index]
+            length = 0
+            while (text[previous + length] == text[current + length] and
+                   text[current + length] != separator):
+                length += 1
+            lcp[index] = length
+        return lcp
+
+    def __len__(self):
+        """Return the number of suffixes stored in this index."""
+        return len(self.suffixes)
+
+    def _find_range(self, fragment):
+        """Return the pair of indexes [low, high) of the range of suffixes in
+        the suffix array that start with the given non-empty fragment.
+        Time Complexity:
+            O(m*log(n) + k) where m is the length of the fragment, n is the
+            number of suffixes, and k is the number of suffixes in the range"""
+        text = self.text
+        length = len(fragment)
+        # Binary search for the first suffix not less than the fragment
+        low, high = 0, len(self.suffixes)
+        while low < high:
+            middle = (low + high) // 2
+            position = self.suffixes[middle]
+            if text[position:position + length] < fragment:
+                low = middle + 1
+            else:
+                high = middle
+        if low == len(self.suffixes):
+            return low, low
+        position = self.suffixes[low]
+        if text[position:position + length] != fragment:
+            return low, low
+        # Later suffixes share at least the fragment while their LCP allows
+        high = low + 1
+        while high < len(self.suffixes) and self.lcp[high] >= length:
+            high += 1
+        return low, high
+
+    def contains_substring(self, fragment):
+        """Return True if any word in this index contains the given fragment.
+        Time Complexity:
+            O(m*log(n)) where m is the length of the fragment and n is the
+            number of suffixes"""
+        if fragment == '':
+            return len(self.words) > 0
+        if SuffixIndex.SEPARATOR in fragment:
+            return False
+        low, high = self._find_range(fragment)
+        return low < high
+
+    def infix_complete(self, fragment):
+        """Return a list of all words in this index that contain the given
+        fragment, in vocabulary order.
+        Time Complexity:
+            O(m*log(n) + k*log(k)) where m is the length of the fragment, n
+            is the number of suffixes, and k is the number of occurrences"""
+        if fragment == '':
+            return list(self.words)
+        if SuffixIndex.SEPARATOR in fragment:
+            return []
+        low, high = self._find_range(fragment)
+        indexes = {bisect_right(self.starts, self.suffixes[index]) - 1
+                   for index in range(low, high)}
+        return [self.words[index] for index in sorted(indexes)]
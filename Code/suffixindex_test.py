@@ -0,0 +1,73 @@
+#!python3
+
+from suffixindex import SuffixIndex
+import unittest
+
+
+class SuffixIndexTest(unittest.TestCase):
+
+    vocabulary = ['banana', 'bandana', 'cabana', 'ban', 'nab', 'banana']
+
+    def test_init_and_properties(self):
+        index = SuffixIndex(self.vocabulary)
+        # Verify duplicate words are stored once
+        assert index.words == ['banana', 'bandana', 'cabana', 'ban', 'nab']
+        assert len(index) == sum(len(word) for word in index.words)
+        # Verify suffixes are sorted and LCPs match adjacent suffixes
+        suffixes = [index.text[position:index.text.index('\0', position)]
+                    for position in index.suffixes]
+        assert suffixes == sorted(suffixes)
+        assert index.lcp[0] == 0
+        for number in range(1, len(suffixes)):
+            previous, current = suffixes[number - 1], suffixes[number]
+            length = 0
+            while (length < min(len(previous), len(current)) and
+                   previous[length] == current[length]):
+                length += 1
+            assert index.lcp[number] == length
+
+    def test_init_with_separator(self):
+        with self.assertRaises(ValueError):
+            SuffixIndex(['ab\0c'])
+
+    def test_contains_substring(self):
+        index = SuffixIndex(self.vocabulary)
+        assert index.contains_substring('ana') is True
+        assert index.contains_substring('dan') is True
+        assert index.contains_substring('cab') is True
+        assert index.contains_substring('nab') is True
+        assert index.contains_substring('') is True
+        assert index.contains_substring('anab') is False
+        assert index.contains_substring('bandanas') is False
+        assert index.contains_substring('z') is False
+        assert index.contains_substring('a\0b') is False
+        assert SuffixIndex([]).contains_substring('') is False
+
+    def test_infix_complete(self):
+        index = SuffixIndex(self.vocabulary)
+        assert index.infix_complete('ana') == ['banana', 'bandana', 'cabana']
+        assert index.infix_complete('ban') == \
+            ['banana', 'bandana', 'cabana', 'ban']
+        assert index.infix_complete('na') == \
+            ['banana', 'bandana', 'cabana', 'nab']
+        assert index.infix_complete('ab') == ['cabana', 'nab']
+        assert index.infix_complete('nab') == ['nab']
+        assert index.infix_complete('bandana') == ['bandana']
+        assert index.infix_complete('nb') == []
+        assert index.infix_complete('\0') == []
+        assert index.infix_complete('') == index.words
+
+    def test_infix_complete_matches_brute_force(self):
+        words = 'Shelly sells seashells by the sea shore'.split()
+        index = SuffixIndex(words)
+        fragments = {word[start:end] for word in words
+                     for start in range(len(word))
+                     for end in range(start + 1, len(word) + 1)}
+        for fragment in fragments | {'shell', 'lls', 'eas', 'xyz'}:
+            expected = [word for word in dict.fromkeys(words)
+                        if fragment in word]
+            assert index.infix_complete(fragment) == expected
+
+
+if __name__ == '__main__':
+    unittest.main()